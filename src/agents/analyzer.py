@@ -2,7 +2,7 @@
 
 import json
 import time
-from datetime import datetime
+from datetime import UTC, datetime
 from typing import Any
 
 import structlog
@@ -17,6 +17,21 @@ from .tools import get_analyzer_tools
 logger = structlog.get_logger(__name__)
 
 
+def _event_timestamp(event: dict[str, Any]) -> datetime:
+    """Get the capture time of a console/network event.
+
+    PageExtractor records epoch seconds; ISO strings are still accepted
+    and read as UTC when they carry no offset.
+    """
+    ts = event.get("timestamp")
+    if isinstance(ts, int | float):
+        return datetime.fromtimestamp(ts, UTC)
+    if isinstance(ts, str):
+        parsed = datetime.fromisoformat(ts)
+        return parsed if parsed.tzinfo else parsed.replace(tzinfo=UTC)
+    return datetime.now(UTC)
+
+
 class PageAnalyzerAgent:
     """Agent for analyzing pages and detecting issues.
 
@@ -169,9 +184,7 @@ class PageAnalyzerAgent:
                 evidence=[Evidence(
                     type="console_log",
                     content=json.dumps(log),
-                    timestamp=datetime.fromisoformat(log["timestamp"])
-                    if isinstance(log.get("timestamp"), str)
-                    else datetime.utcnow(),
+                    timestamp=_event_timestamp(log),
                     metadata={
                         "level": level,
                         "location": log.get("location"),
@@ -242,9 +255,7 @@ class PageAnalyzerAgent:
                 evidence=[Evidence(
                     type="network_request",
                     content=json.dumps(request),
-                    timestamp=datetime.fromisoformat(request["timestamp"])
-                    if isinstance(request.get("timestamp"), str)
-                    else datetime.utcnow(),
+                    timestamp=_event_timestamp(request),
                     metadata={
                         "status_code": status,
                         "request_method": method,
@@ -284,9 +295,7 @@ class PageAnalyzerAgent:
                 evidence=[Evidence(
                     type="network_request",
                     content=json.dumps(error),
-                    timestamp=datetime.fromisoformat(error["timestamp"])
-                    if isinstance(error.get("timestamp"), str)
-                    else datetime.utcnow(),
+                    timestamp=_event_timestamp(error),
                     metadata={
                         "failure": failure,
                         "request_method": method,
@@ -335,7 +344,7 @@ class PageAnalyzerAgent:
                 evidence=[Evidence(
                     type="performance_metrics",
                     content=json.dumps(metrics),
-                    timestamp=datetime.utcnow(),
+                    timestamp=datetime.now(UTC),
                     metadata={"load_time_ms": load_time}
                 )],
                 confidence=confidence,
@@ -368,9 +377,7 @@ class PageAnalyzerAgent:
                     evidence=[Evidence(
                         type="network_request",
                         content=json.dumps(request),
-                        timestamp=datetime.fromisoformat(request["timestamp"])
-                        if isinstance(request.get("timestamp"), str)
-                        else datetime.utcnow(),
+                        timestamp=_event_timestamp(request),
                         metadata={
                             "duration_ms": total_time,
                             "request_url": url,
@@ -424,9 +431,7 @@ class PageAnalyzerAgent:
                     evidence=[Evidence(
                         type="console_log",
                         content=json.dumps(log),
-                        timestamp=datetime.fromisoformat(log["timestamp"])
-                        if isinstance(log.get("timestamp"), str)
-                        else datetime.utcnow(),
+                        timestamp=_event_timestamp(log),
                     )],
                     confidence=0.70,
                     severity="low",
@@ -468,7 +473,7 @@ class PageAnalyzerAgent:
                     evidence=[Evidence(
                         type="dom_snapshot",
                         content=json.dumps(form),
-                        timestamp=datetime.utcnow(),
+                        timestamp=datetime.now(UTC),
                         metadata={"form_id": form_id}
                     )],
                     confidence=0.65,
@@ -495,7 +500,7 @@ class PageAnalyzerAgent:
                             evidence=[Evidence(
                                 type="dom_snapshot",
                                 content=json.dumps(inp),
-                                timestamp=datetime.utcnow(),
+                                timestamp=datetime.now(UTC),
                             )],
                             confidence=0.75,
                             severity="medium",
@@ -14,7 +14,7 @@ import structlog
 from fastapi import FastAPI, Request, status
 from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 from starlette.exceptions import HTTPException as StarletteHTTPException
 
 from ..core.config import get_settings
@@ -82,6 +82,7 @@ app = FastAPI(
     ),
     version="0.1.0",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
     docs_url="/docs" if settings.is_development else None,
     redoc_url="/redoc" if settings.is_development else None,
     openapi_url="/openapi.json" if settings.is_development else None,
@@ -110,7 +111,7 @@ app.add_middleware(RequestLoggingMiddleware)
 async def http_exception_handler(
     request: Request,
     exc: StarletteHTTPException
-) -> JSONResponse:
+) -> ORJSONResponse:
     """
     Handle HTTP exceptions with consistent error format.
 
@@ -136,7 +137,7 @@ async def http_exception_handler(
         request_id=request_id,
     )
 
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=exc.status_code,
         content=error_response.model_dump(),
     )
@@ -146,7 +147,7 @@ async def http_exception_handler(
 async def validation_exception_handler(
     request: Request,
     exc: RequestValidationError
-) -> JSONResponse:
+) -> ORJSONResponse:
     """
     Handle request validation errors with detailed field information.
 
@@ -182,7 +183,7 @@ async def validation_exception_handler(
         validation_errors=validation_errors,
     )
 
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
         content=error_response.model_dump(),
     )
@@ -192,7 +193,7 @@ async def validation_exception_handler(
 async def general_exception_handler(
     request: Request,
     exc: Exception
-) -> JSONResponse:
+) -> ORJSONResponse:
     """
     Handle unexpected exceptions with logging.
 
@@ -222,7 +223,7 @@ async def general_exception_handler(
         request_id=request_id,
     )
 
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
         content=error_response.model_dump(),
     )
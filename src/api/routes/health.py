@@ -1,10 +1,10 @@
 """Health check endpoints."""
 
 import time
-from datetime import datetime
 
 import structlog
 from fastapi import APIRouter, Depends
+from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ...core.config import get_settings
@@ -28,10 +28,7 @@ async def health_check() -> HealthResponse:
     Returns 200 if service is running.
     This is a lightweight check suitable for frequent polling.
     """
-    return HealthResponse(
-        status="healthy",
-        timestamp=datetime.utcnow(),
-    )
+    return HealthResponse(status="healthy")
 
 
 @router.get(
@@ -78,7 +75,6 @@ async def detailed_health(
 
     return DetailedHealthResponse(
         status=overall_status,
-        timestamp=datetime.utcnow(),
         services=services,
     )
 
@@ -97,7 +93,7 @@ async def _check_database(db: AsyncSession) -> ServiceHealth:
         start_time = time.time()
 
         # Simple query to test connection
-        await db.execute("SELECT 1")
+        await db.execute(text("SELECT 1"))
 
         latency_ms = (time.time() - start_time) * 1000
 
@@ -3,15 +3,23 @@
 These complement the Pydantic models in src/models/.
 """
 
-from datetime import datetime
+from datetime import UTC, datetime
 from typing import Literal
 from uuid import UUID
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator
 
 from ..models.bug import Bug
 from ..models.crawl import CrawlConfig
 
+_now = datetime.now
+
+
+def _now_utc() -> datetime:
+    """Timezone-aware UTC timestamp used as a response default."""
+    return _now(UTC)
+
+
 # ===== Crawl Endpoints =====
 
 class CrawlStartRequest(BaseModel):
@@ -47,16 +55,21 @@ class CrawlStartRequest(BaseModel):
         description="Whether to follow links outside base domain"
     )
 
+    @field_validator("base_url")
+    @classmethod
+    def validate_base_url(cls, v: str) -> str:
+        """Apply CrawlConfig's base_url rules at request time."""
+        return CrawlConfig.validate_base_url(v)
+
     def to_crawl_config(self) -> CrawlConfig:
-        """Convert to CrawlConfig model."""
-        return CrawlConfig(
-            base_url=self.base_url,
-            auth_method=self.auth_method,
-            credentials=self.credentials,
-            max_pages=self.max_pages,
-            max_depth=self.max_depth,
-            excluded_patterns=self.excluded_patterns,
-            follow_external_links=self.follow_external_links,
+        """Convert to CrawlConfig model.
+
+        Every field shared with CrawlConfig carries the same constraints here,
+        so the already-validated values are copied without re-validation.
+        """
+        return CrawlConfig.model_construct(
+            _fields_set=self.model_fields_set,
+            **self.__dict__,
         )
 
 
@@ -172,7 +185,7 @@ class HealthResponse(BaseModel):
     """Basic health check response."""
 
     status: Literal["healthy", "unhealthy"]
-    timestamp: datetime = Field(default_factory=datetime.utcnow)
+    timestamp: datetime = Field(default_factory=_now_utc)
     version: str = Field(default="0.1.0")
 
 
@@ -189,7 +202,7 @@ class DetailedHealthResponse(BaseModel):
     """Detailed health check with dependency status."""
 
     status: Literal["healthy", "unhealthy", "degraded"]
-    timestamp: datetime = Field(default_factory=datetime.utcnow)
+    timestamp: datetime = Field(default_factory=_now_utc)
     version: str = Field(default="0.1.0")
     services: list[ServiceHealth] = Field(
         description="Health status of each service"
@@ -8,6 +8,7 @@ Main Components:
 - BrowserbaseClient: Manages remote browser sessions via Browserbase
 - PageExtractor: Extracts comprehensive data from web pages
 - Navigator: Provides human-like navigation and interaction patterns
+- PagePool: Reuses pre-warmed pages across navigations
 
 Example Usage:
     ```python
@@ -53,7 +54,7 @@ Example Usage:
 
 from src.browser.client import BrowserbaseClient, BrowserbaseSessionError
 from src.browser.extractor import PageExtractor
-from src.browser.navigator import NavigationError, Navigator
+from src.browser.navigator import NavigationError, Navigator, PagePool
 
 __all__ = [
     # Client
@@ -64,4 +65,5 @@ __all__ = [
     # Navigator
     "Navigator",
     "NavigationError",
+    "PagePool",
 ]
@@ -14,13 +14,17 @@ Key Features:
 
 import time
 from typing import Any, Literal
+from urllib.parse import quote
 
 import httpx
+import orjson
 import structlog
 from playwright.async_api import Browser, BrowserContext, Page, async_playwright
 
 logger = structlog.get_logger(__name__)
 
+_PAGE_META_JS = "() => ({url: location.href, title: document.title})"
+
 
 class BrowserbaseSessionError(Exception):
     """Raised when Browserbase session operations fail."""
@@ -56,6 +60,7 @@ class BrowserbaseClient:
         api_key: str,
         project_id: str | None = None,
         timeout: int = 300,
+        enable_proxy: bool = True,
     ) -> None:
         """Initialize Browserbase client.
 
@@ -63,10 +68,27 @@ class BrowserbaseClient:
             api_key: Browserbase API key
             project_id: Optional project ID for session creation
             timeout: Session timeout in seconds (default: 300)
+            enable_proxy: Route browser traffic through Browserbase proxies (default: True)
         """
         self.api_key = api_key
         self.project_id = project_id
         self.timeout = timeout
+        self.enable_proxy = enable_proxy
+
+        # WebSocket endpoint prefix; only the session ID varies per connect
+        self._ws_base_qs = (
+            f"{self.WS_BASE_URL}?apiKey={quote(api_key, safe='')}"
+            f"&enableProxy={'true' if enable_proxy else 'false'}"
+        )
+
+        # Session creation request is identical for every call; encode it once
+        self._session_create_headers = {
+            "x-bb-api-key": api_key,
+            "Content-Type": "application/json",
+        }
+        self._session_create_body = orjson.dumps(
+            {"timeout": timeout, **({"projectId": project_id} if project_id else {})}
+        )
 
         # Session state
         self.session_id: str | None = None
@@ -142,23 +164,16 @@ class BrowserbaseClient:
             BrowserbaseSessionError: If API request fails
         """
         url = f"{self.API_BASE_URL}/sessions"
-        headers = {
-            "x-bb-api-key": self.api_key,
-            "Content-Type": "application/json",
-        }
-
-        payload: dict[str, Any] = {
-            "timeout": self.timeout,
-        }
-
-        if self.project_id:
-            payload["projectId"] = self.project_id
 
         async with httpx.AsyncClient(timeout=30.0) as client:
             try:
-                response = await client.post(url, json=payload, headers=headers)
+                response = await client.post(
+                    url,
+                    content=self._session_create_body,
+                    headers=self._session_create_headers,
+                )
                 response.raise_for_status()
-                return response.json()
+                return orjson.loads(response.content)
             except httpx.HTTPStatusError as e:
                 error_detail = e.response.text if hasattr(e.response, "text") else str(e)
                 logger.error(
@@ -183,7 +198,7 @@ class BrowserbaseClient:
             raise BrowserbaseSessionError("No session ID available for connection")
 
         # Build WebSocket endpoint URL
-        ws_endpoint = f"{self.WS_BASE_URL}?apiKey={self.api_key}&sessionId={self.session_id}&enableProxy=true"
+        ws_endpoint = f"{self._ws_base_qs}&sessionId={self.session_id}"
 
         try:
             # Initialize Playwright
@@ -248,10 +263,13 @@ class BrowserbaseClient:
 
             navigation_time = time.time() - start_time
 
+            # Fetch final URL and title in a single CDP round-trip
+            meta = await self.page.evaluate(_PAGE_META_JS)
+
             result = {
                 "status": response.status if response else None,
-                "url": self.page.url,
-                "title": await self.page.title(),
+                "url": meta["url"],
+                "title": meta["title"],
                 "navigation_time_ms": int(navigation_time * 1000),
             }
 
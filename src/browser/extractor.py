@@ -5,16 +5,161 @@ browser pages including console logs, network requests, forms, links, and
 performance metrics.
 """
 
+import asyncio
+import logging
 import time
-from datetime import datetime
+from collections import deque
+from collections.abc import Callable
 from typing import Any
 from urllib.parse import urlparse
 
+import orjson
 import structlog
 from playwright.async_api import Page, Response
 
 logger = structlog.get_logger(__name__)
 
+# Events are stamped with raw epoch seconds; formatting is left to consumers
+_NOW = time.time
+
+# Captured events are batched into the buffers at most this often
+_FLUSH_INTERVAL_S = 0.05
+
+# Errors, warnings and failures detailed in one flush's log record
+_MAX_LOGGED_EVENTS = 20
+
+# Ports the browser leaves out of an anchor's origin
+_DEFAULT_PORTS = {"http": ":80", "https": ":443"}
+
+# Resource types whose response headers are worth keeping regardless of status
+_HEADER_RESOURCE_TYPES = frozenset({"document", "xhr", "fetch"})
+
+
+def _capture_interesting_headers(response: Response) -> bool:
+    """Default header-capture predicate: errors, documents and API calls."""
+    return response.status >= 400 or response.request.resource_type in _HEADER_RESOURCE_TYPES
+
+
+# Installed before any page script runs; collects metrics only observable
+# while the page loads (LCP, layout shifts, long tasks)
+_METRICS_INIT_JS = """
+(() => {
+    if (window.__bughive_metrics) return;
+    const metrics = window.__bughive_metrics = {
+        largestContentfulPaint: 0,
+        cumulativeLayoutShift: 0,
+        longTaskCount: 0,
+        longTaskTime: 0,
+    };
+    const observe = (type, onEntry) => {
+        try {
+            new PerformanceObserver(list => list.getEntries().forEach(onEntry))
+                .observe({type, buffered: true});
+        } catch (e) {
+            // Entry type not supported by this browser
+        }
+    };
+    observe('largest-contentful-paint', e => { metrics.largestContentfulPaint = e.startTime; });
+    observe('layout-shift', e => { if (!e.hadRecentInput) metrics.cumulativeLayoutShift += e.value; });
+    observe('longtask', e => { metrics.longTaskCount += 1; metrics.longTaskTime += e.duration; });
+})();
+"""
+
+# Page scripts, built once at import and reused for every evaluate call
+
+# Inputs only carry non-empty attributes; select options are capped at
+# maxOptions with the full count reported in optionCount
+_FORMS_JS = """
+(maxOptions) => Array.from(document.forms).map(form => {
+    const inputs = Array.from(form.elements).map(el => {
+        const tagName = el.tagName.toLowerCase();
+        const input = {type: el.type || '', tagName};
+        if (el.name) input.name = el.name;
+        if (el.id) input.id = el.id;
+        if (el.required) input.required = true;
+        if (el.placeholder) input.placeholder = el.placeholder;
+
+        // Add options for select elements
+        if (tagName === 'select') {
+            input.options = Array.from(el.options).slice(0, maxOptions).map(opt => ({
+                value: opt.value,
+                text: opt.text,
+            }));
+            input.optionCount = el.options.length;
+        }
+
+        return input;
+    });
+
+    return {
+        id: form.id || '',
+        name: form.name || '',
+        action: form.action || '',
+        method: form.method || 'get',
+        target: form.target || '',
+        inputCount: inputs.length,
+        inputs: inputs,
+    };
+})
+"""
+
+# Keeps anchors on the given origin (if any) and deduplicates in document
+# order. Comparing the anchor's parsed origin is exact, unlike a string
+# prefix check that would also accept https://example.com.evil.org
+_LINKS_JS = """
+(origin) => Array.from(new Set(
+    Array.from(document.querySelectorAll('a[href]'))
+        .filter(a => !origin || a.origin === origin)
+        .map(a => a.href)
+        .filter(href => href && !href.startsWith('javascript:') && !href.startsWith('#'))
+))
+"""
+
+_PERFORMANCE_JS = """
+() => {
+    const perfData = performance.getEntriesByType('navigation')[0];
+    const fp = performance.getEntriesByName('first-paint')[0];
+    const fcp = performance.getEntriesByName('first-contentful-paint')[0];
+
+    return {
+        ...(window.__bughive_metrics || {}),
+        loadTime: perfData ? perfData.loadEventEnd - perfData.fetchStart : 0,
+        domReady: perfData ? perfData.domContentLoadedEventEnd - perfData.fetchStart : 0,
+        firstPaint: fp ? fp.startTime : 0,
+        firstContentfulPaint: fcp ? fcp.startTime : 0,
+        dns: perfData ? perfData.domainLookupEnd - perfData.domainLookupStart : 0,
+        tcp: perfData ? perfData.connectEnd - perfData.connectStart : 0,
+        request: perfData ? perfData.responseStart - perfData.requestStart : 0,
+        response: perfData ? perfData.responseEnd - perfData.responseStart : 0,
+        domProcessing: perfData ? perfData.domComplete - perfData.domLoading : 0,
+    };
+}
+"""
+
+# The selector engine skips metas without content before the loop runs
+_META_TAGS_JS = """
+() => Object.fromEntries(
+    Array.from(document.querySelectorAll('meta[content]:not([content=""])'))
+        .map(meta => [
+            meta.getAttribute('name') || meta.getAttribute('property') || meta.getAttribute('http-equiv'),
+            meta.getAttribute('content'),
+        ])
+        .filter(([name]) => name)
+)
+"""
+
+# Fused extraction script: forms, links, performance, meta tags and title
+# gathered in one browser round-trip instead of five.
+_EXTRACT_ALL_JS = f"""
+({{origin, maxOptions}}) => ({{
+    forms: ({_FORMS_JS})(maxOptions),
+    links: ({_LINKS_JS})(origin),
+    performance: ({_PERFORMANCE_JS})(),
+    metaTags: ({_META_TAGS_JS})(),
+    title: document.title,
+}})
+"""
+
 
 class PageExtractor:
     """Extracts comprehensive data from browser pages.
@@ -28,27 +173,87 @@ class PageExtractor:
         base_url: Base URL for filtering internal links
     """
 
-    def __init__(self, page: Page, base_url: str | None = None) -> None:
+    def __init__(
+        self,
+        page: Page,
+        base_url: str | None = None,
+        max_events: int = 10_000,
+        capture_headers: Callable[[Response], bool] = _capture_interesting_headers,
+        max_options: int = 50,
+        slow_threshold_ms: int = 1000,
+    ) -> None:
         """Initialize page extractor.
 
         Args:
             page: Playwright Page instance
             base_url: Base URL for internal link filtering (uses page.url if None)
+            max_events: Most recent events kept per buffer (default: 10000)
+            capture_headers: Predicate selecting responses whose headers are
+                stored; others get ``headers=None``. Defaults to error responses
+                plus document/xhr/fetch requests. Pass ``lambda r: True`` to
+                keep every response's headers.
+            max_options: Options reported per <select> in extract_forms()
+                (default: 50); ``optionCount`` always holds the full count
+            slow_threshold_ms: Responses slower than this are indexed as slow
+                at capture time (default: 1000)
         """
         self.page = page
         self.base_url = base_url
-
-        # Storage for captured data
-        self._console_logs: list[dict[str, Any]] = []
-        self._network_responses: list[dict[str, Any]] = []
-        self._network_errors: list[dict[str, Any]] = []
+        self._capture_headers = capture_headers
+        self._max_options = max_options
+        self._slow_threshold_ms = slow_threshold_ms
+
+        # Origin for internal link filtering; resolved from page.url on first
+        # use when no base_url is given
+        self._origin: str | None = self._parse_origin(base_url) if base_url else None
+
+        self._max_events = max_events
+        self._flush_handle: asyncio.TimerHandle | None = None
+        self._listeners_installed = False
+        self._metrics_script_installed = False
+        self._reset_buffers()
+
+    def _reset_buffers(self) -> None:
+        """Allocate fresh capture buffers.
+
+        Buffers are replaced rather than cleared so live views handed out
+        by extract_all(live_buffers=True) stay intact. Events still waiting to be flushed are
+        dropped.
+        """
+        max_events = self._max_events
+
+        # Storage for captured data (oldest events drop off once full)
+        self._console_logs: deque[dict[str, Any]] = deque(maxlen=max_events)
+        self._network_responses: deque[dict[str, Any]] = deque(maxlen=max_events)
+        self._network_errors: deque[dict[str, Any]] = deque(maxlen=max_events)
+
+        # Side indices filled at capture time so get_* accessors never rescan
+        self._console_errors: deque[dict[str, Any]] = deque(maxlen=max_events)
+        self._console_warnings: deque[dict[str, Any]] = deque(maxlen=max_events)
+        self._failed_responses: deque[dict[str, Any]] = deque(maxlen=max_events)
+        self._slow_responses: deque[dict[str, Any]] = deque(maxlen=max_events)
+
+        # Events captured since the last flush, as (kind, entry) pairs
+        self._pending: deque[tuple[str, dict[str, Any]]] = deque()
+        self._cancel_flush()
         self._start_time = time.time()
 
     async def setup_listeners(self) -> None:
         """Set up console and network listeners before navigation.
 
-        This must be called before navigating to capture all events.
+        This must be called before navigating to capture all events. Repeated
+        calls are no-ops until teardown(), so retry paths cannot register the
+        handlers twice and duplicate every event.
         """
+        if self._listeners_installed:
+            return
+
+        # Browser-side performance observers, active from the next navigation.
+        # Init scripts cannot be removed, so this survives teardown().
+        if not self._metrics_script_installed:
+            await self.page.add_init_script(script=_METRICS_INIT_JS)
+            self._metrics_script_installed = True
+
         # Console listener
         self.page.on("console", self._handle_console)
 
@@ -58,26 +263,129 @@ class PageExtractor:
         # Network request failure listener
         self.page.on("requestfailed", self._handle_request_failed)
 
+        self._listeners_installed = True
         logger.debug("page_listeners_setup", url=self.page.url)
 
+    def teardown(self) -> None:
+        """Detach the console and network listeners from the page.
+
+        Events already captured are flushed and kept.
+        """
+        if not self._listeners_installed:
+            return
+
+        self.page.remove_listener("console", self._handle_console)
+        self.page.remove_listener("response", self._handle_response)
+        self.page.remove_listener("requestfailed", self._handle_request_failed)
+        self._listeners_installed = False
+        self._flush_pending()
+
+        logger.debug("page_listeners_removed", url=self.page.url)
+
+    def _enqueue(self, kind: str, entry: dict[str, Any]) -> None:
+        """Queue a captured event and make sure a flush is scheduled.
+
+        Playwright invokes listeners on the event loop thread, so a single
+        call_later per flush window is enough to batch bursts of events.
+        Outside a running loop the event is flushed immediately.
+        """
+        self._pending.append((kind, entry))
+        if self._flush_handle is not None:
+            return
+
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self._flush_pending()
+            return
+
+        self._flush_handle = loop.call_later(_FLUSH_INTERVAL_S, self._flush_pending)
+
+    def _cancel_flush(self) -> None:
+        """Cancel a scheduled flush, if any."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+
+    def _flush_pending(self) -> None:
+        """Move queued events into the capture buffers.
+
+        Called by the flush timer and before any read, so accessors always see
+        every captured event. Emits one log record per flush that contained
+        errors, warnings or failures, carrying their counts and the details
+        of the first _MAX_LOGGED_EVENTS of them.
+        """
+        self._cancel_flush()
+        if not self._pending:
+            return
+
+        # Skip building truncated details when structlog filters out INFO
+        log_enabled = logger.is_enabled_for(logging.INFO)
+        logged: list[dict[str, Any]] = []
+
+        def note(details: dict[str, Any]) -> None:
+            if log_enabled and len(logged) < _MAX_LOGGED_EVENTS:
+                logged.append(details)
+
+        console_errors = console_warnings = failed_responses = failed_requests = 0
+        pending = self._pending
+        while pending:
+            kind, entry = pending.popleft()
+            if kind == "console":
+                self._console_logs.append(entry)
+                level = entry["level"]
+                if level == "error":
+                    self._console_errors.append(entry)
+                    console_errors += 1
+                elif level == "warning":
+                    self._console_warnings.append(entry)
+                    console_warnings += 1
+                else:
+                    continue
+                # Truncate long messages
+                note({"kind": "console", "level": level, "text": entry["text"][:200]})
+            elif kind == "response":
+                self._network_responses.append(entry)
+                if entry["status"] >= 400:
+                    self._failed_responses.append(entry)
+                    failed_responses += 1
+                    note({
+                        "kind": "error_response",
+                        "url": entry["url"][:100],
+                        "status": entry["status"],
+                        "method": entry["method"],
+                    })
+                timing = entry["timing"]
+                if timing and timing.get("total", 0) > self._slow_threshold_ms:
+                    self._slow_responses.append(entry)
+            else:
+                self._network_errors.append(entry)
+                failed_requests += 1
+                note({
+                    "kind": "request_failed",
+                    "url": entry["url"][:100],
+                    "failure": entry["failure"],
+                })
+
+        if logged:
+            logger.info(
+                "page_events_captured",
+                console_errors=console_errors,
+                console_warnings=console_warnings,
+                failed_responses=failed_responses,
+                failed_requests=failed_requests,
+                events=logged,
+            )
+
     def _handle_console(self, msg: Any) -> None:
         """Handle console messages."""
         try:
-            log_entry = {
+            self._enqueue("console", {
                 "level": msg.type,
                 "text": msg.text,
-                "timestamp": datetime.utcnow().isoformat(),
-                "location": msg.location if hasattr(msg, "location") else None,
-            }
-            self._console_logs.append(log_entry)
-
-            # Log errors and warnings
-            if msg.type in ("error", "warning"):
-                logger.info(
-                    "console_message",
-                    level=msg.type,
-                    text=msg.text[:200],  # Truncate long messages
-                )
+                "timestamp": _NOW(),
+                "location": msg.location,
+            })
         except Exception as e:
             logger.warning("console_handler_error", error=str(e))
 
@@ -99,45 +407,31 @@ class PageExtractor:
             except Exception:
                 pass
 
-            response_entry = {
+            # Only materialize headers for responses consumers look at
+            headers = dict(response.headers) if self._capture_headers(response) else None
+
+            self._enqueue("response", {
                 "url": response.url,
                 "status": response.status,
                 "method": response.request.method,
                 "resource_type": response.request.resource_type,
-                "timestamp": datetime.utcnow().isoformat(),
+                "timestamp": _NOW(),
                 "timing": timing,
-                "headers": dict(response.headers) if hasattr(response, "headers") else {},
-            }
-            self._network_responses.append(response_entry)
-
-            # Log non-200 responses
-            if response.status >= 400:
-                logger.info(
-                    "network_error_response",
-                    url=response.url[:100],
-                    status=response.status,
-                    method=response.request.method,
-                )
+                "headers": headers,
+            })
         except Exception as e:
             logger.warning("response_handler_error", error=str(e))
 
     def _handle_request_failed(self, request: Any) -> None:
         """Handle failed network requests."""
         try:
-            error_entry = {
+            self._enqueue("failed", {
                 "url": request.url,
                 "method": request.method,
                 "resource_type": request.resource_type,
                 "failure": request.failure,
-                "timestamp": datetime.utcnow().isoformat(),
-            }
-            self._network_errors.append(error_entry)
-
-            logger.info(
-                "network_request_failed",
-                url=request.url[:100],
-                failure=request.failure,
-            )
+                "timestamp": _NOW(),
+            })
         except Exception as e:
             logger.warning("request_failed_handler_error", error=str(e))
 
@@ -148,46 +442,7 @@ class PageExtractor:
             list: Form data including inputs, actions, methods
         """
         try:
-            forms_data = await self.page.evaluate("""
-                () => {
-                    return Array.from(document.forms).map(form => {
-                        const inputs = Array.from(form.elements).map(el => {
-                            const input = {
-                                name: el.name || '',
-                                type: el.type || '',
-                                id: el.id || '',
-                                required: el.required || false,
-                                tagName: el.tagName.toLowerCase(),
-                            };
-
-                            // Add placeholder if exists
-                            if (el.placeholder) {
-                                input.placeholder = el.placeholder;
-                            }
-
-                            // Add options for select elements
-                            if (el.tagName.toLowerCase() === 'select') {
-                                input.options = Array.from(el.options).map(opt => ({
-                                    value: opt.value,
-                                    text: opt.text,
-                                }));
-                            }
-
-                            return input;
-                        });
-
-                        return {
-                            id: form.id || '',
-                            name: form.name || '',
-                            action: form.action || '',
-                            method: form.method || 'get',
-                            target: form.target || '',
-                            inputCount: inputs.length,
-                            inputs: inputs,
-                        };
-                    });
-                }
-            """)
+            forms_data = await self.page.evaluate(_FORMS_JS, self._max_options)
 
             logger.debug("forms_extracted", count=len(forms_data))
             return forms_data
@@ -206,78 +461,33 @@ class PageExtractor:
             list: List of URLs
         """
         try:
-            # Get base URL for filtering
-            base_url = self.base_url or self.page.url
-            parsed_base = urlparse(base_url)
-            origin = f"{parsed_base.scheme}://{parsed_base.netloc}"
-
-            # Extract all links
-            all_links = await self.page.evaluate("""
-                () => {
-                    return Array.from(document.querySelectorAll('a[href]'))
-                        .map(a => a.href)
-                        .filter(href => href && !href.startsWith('javascript:') && !href.startsWith('#'));
-                }
-            """)
-
-            # Filter internal links if requested
-            if internal_only:
-                links = [link for link in all_links if link.startswith(origin)]
-            else:
-                links = all_links
-
-            # Deduplicate
-            unique_links = list(set(links))
-
-            logger.debug(
-                "links_extracted",
-                total=len(all_links),
-                internal=len(unique_links),
-                internal_only=internal_only,
+            # Filter and deduplicate (order-preserving) inside the browser so
+            # only the links we keep cross the CDP bridge
+            links = await self.page.evaluate(
+                _LINKS_JS,
+                self._link_origin() if internal_only else None,
             )
 
-            return unique_links
+            logger.debug("links_extracted", count=len(links), internal_only=internal_only)
+
+            return links
 
         except Exception as e:
             logger.error("link_extraction_failed", error=str(e))
             return []
 
     async def extract_performance_metrics(self) -> dict[str, Any]:
-        """Extract performance metrics using Navigation Timing API.
+        """Extract performance metrics.
+
+        Combines a Navigation/Paint Timing snapshot with the LCP, layout-shift
+        and long-task values collected by the observers installed in
+        setup_listeners().
 
         Returns:
             dict: Performance metrics including load times
         """
         try:
-            metrics = await self.page.evaluate("""
-                () => {
-                    const perfData = performance.getEntriesByType('navigation')[0];
-                    const paintData = performance.getEntriesByType('paint');
-
-                    const result = {
-                        loadTime: perfData ? perfData.loadEventEnd - perfData.fetchStart : 0,
-                        domReady: perfData ? perfData.domContentLoadedEventEnd - perfData.fetchStart : 0,
-                        firstPaint: 0,
-                        largestPaint: 0,
-                        dns: perfData ? perfData.domainLookupEnd - perfData.domainLookupStart : 0,
-                        tcp: perfData ? perfData.connectEnd - perfData.connectStart : 0,
-                        request: perfData ? perfData.responseStart - perfData.requestStart : 0,
-                        response: perfData ? perfData.responseEnd - perfData.responseStart : 0,
-                        domProcessing: perfData ? perfData.domComplete - perfData.domLoading : 0,
-                    };
-
-                    // Get paint timings
-                    for (const entry of paintData) {
-                        if (entry.name === 'first-paint') {
-                            result.firstPaint = entry.startTime;
-                        } else if (entry.name === 'first-contentful-paint') {
-                            result.largestPaint = entry.startTime;
-                        }
-                    }
-
-                    return result;
-                }
-            """)
+            metrics = await self.page.evaluate(_PERFORMANCE_JS)
 
             logger.debug("performance_metrics_extracted", load_time=metrics.get("loadTime"))
             return metrics
@@ -293,19 +503,7 @@ class PageExtractor:
             dict: Meta tag key-value pairs
         """
         try:
-            meta_tags = await self.page.evaluate("""
-                () => {
-                    const metas = {};
-                    document.querySelectorAll('meta').forEach(meta => {
-                        const name = meta.getAttribute('name') || meta.getAttribute('property') || meta.getAttribute('http-equiv');
-                        const content = meta.getAttribute('content');
-                        if (name && content) {
-                            metas[name] = content;
-                        }
-                    });
-                    return metas;
-                }
-            """)
+            meta_tags = await self.page.evaluate(_META_TAGS_JS)
 
             logger.debug("meta_tags_extracted", count=len(meta_tags))
             return meta_tags
@@ -314,27 +512,54 @@ class PageExtractor:
             logger.error("meta_tag_extraction_failed", error=str(e))
             return {}
 
-    async def extract_all(self) -> dict[str, Any]:
+    async def extract_all(self, live_buffers: bool = False) -> dict[str, Any]:
         """Extract all relevant data from current page.
 
+        Args:
+            live_buffers: Return the live console/network deques instead of
+                list copies. They keep receiving events until clear_data()
+                is called and must not be mutated; only use this when the
+                result is consumed immediately.
+
         Returns:
             dict: Comprehensive page data including all extracted information
         """
         logger.info("extracting_page_data", url=self.page.url)
+        self._flush_pending()
 
-        # Extract all data in parallel
-        forms = await self.extract_forms()
-        links = await self.extract_links(internal_only=True)
-        performance = await self.extract_performance_metrics()
-        meta_tags = await self.extract_meta_tags()
+        # Collect every DOM category in a single evaluate round-trip
+        try:
+            data = await self.page.evaluate(
+                _EXTRACT_ALL_JS,
+                {"origin": self._link_origin(), "maxOptions": self._max_options},
+            )
+            forms = data["forms"]
+            links = data["links"]
+            performance = data["performance"]
+            meta_tags = data["metaTags"]
+            title = data["title"]
+        except Exception as e:
+            # One failing category sinks the fused script; fall back to the
+            # per-category extractors, which isolate their own errors and run
+            # concurrently over the same CDP connection.
+            logger.warning("fused_extraction_failed", error=str(e))
+            forms, links, performance, meta_tags, title = await asyncio.gather(
+                self.extract_forms(),
+                self.extract_links(internal_only=True),
+                self.extract_performance_metrics(),
+                self.extract_meta_tags(),
+                self.page.title(),
+            )
 
         # Build result
         result = {
             "url": self.page.url,
-            "title": await self.page.title(),
-            "console_logs": self._console_logs.copy(),
-            "network_requests": self._network_responses.copy(),
-            "network_errors": self._network_errors.copy(),
+            "title": title,
+            "console_logs": self._console_logs if live_buffers else list(self._console_logs),
+            "network_requests": (
+                self._network_responses if live_buffers else list(self._network_responses)
+            ),
+            "network_errors": self._network_errors if live_buffers else list(self._network_errors),
             "forms": forms,
             "links": links,
             "performance_metrics": performance,
@@ -354,13 +579,45 @@ class PageExtractor:
 
         return result
 
+    @staticmethod
+    def _parse_origin(url: str) -> str:
+        """Reduce a URL to ``scheme://host[:port]``, as ``HTMLAnchorElement.origin``."""
+        parsed = urlparse(url)
+        host = parsed.netloc.rpartition("@")[2].lower()
+        default_port = _DEFAULT_PORTS.get(parsed.scheme)
+        if default_port and host.endswith(default_port):
+            host = host[: -len(default_port)]
+        return f"{parsed.scheme}://{host}"
+
+    def _link_origin(self) -> str:
+        """Get the origin internal links must start with.
+
+        Returns:
+            str: Origin of the base URL (or of the page URL at first use)
+        """
+        if self._origin is None:
+            self._origin = self._parse_origin(self.page.url)
+        return self._origin
+
+    async def extract_all_json(self) -> bytes:
+        """Extract all page data serialized as JSON.
+
+        Uses orjson; the live event buffers are encoded directly without
+        an intermediate list copy.
+
+        Returns:
+            bytes: UTF-8 JSON document of extract_all()'s result
+        """
+        return orjson.dumps(await self.extract_all(live_buffers=True), default=list)
+
     def get_console_errors(self) -> list[dict[str, Any]]:
         """Get all console error messages.
 
         Returns:
             list: Console errors
         """
-        return [log for log in self._console_logs if log["level"] == "error"]
+        self._flush_pending()
+        return list(self._console_errors)
 
     def get_console_warnings(self) -> list[dict[str, Any]]:
         """Get all console warning messages.
@@ -368,7 +625,8 @@ class PageExtractor:
         Returns:
             list: Console warnings
         """
-        return [log for log in self._console_logs if log["level"] == "warning"]
+        self._flush_pending()
+        return list(self._console_warnings)
 
     def get_failed_requests(self) -> list[dict[str, Any]]:
         """Get all failed network requests (4xx, 5xx).
@@ -376,30 +634,37 @@ class PageExtractor:
         Returns:
             list: Failed requests
         """
-        return [
-            req for req in self._network_responses
-            if req["status"] >= 400
-        ]
+        self._flush_pending()
+        return list(self._failed_responses)
 
-    def get_slow_requests(self, threshold_ms: int = 1000) -> list[dict[str, Any]]:
+    def get_slow_requests(self, threshold_ms: int | None = None) -> list[dict[str, Any]]:
         """Get network requests slower than threshold.
 
         Args:
-            threshold_ms: Threshold in milliseconds (default: 1000)
+            threshold_ms: Threshold in milliseconds (default: the extractor's
+                slow_threshold_ms, served from the capture-time index; other
+                values rescan all responses)
 
         Returns:
             list: Slow requests
         """
+        self._flush_pending()
+        if threshold_ms is None or threshold_ms == self._slow_threshold_ms:
+            return list(self._slow_responses)
+
         slow = []
         for req in self._network_responses:
             if req.get("timing") and req["timing"].get("total", 0) > threshold_ms:
                 slow.append(req)
         return slow
 
-    def clear_data(self) -> None:
-        """Clear all captured data."""
-        self._console_logs.clear()
-        self._network_responses.clear()
-        self._network_errors.clear()
-        self._start_time = time.time()
+    def clear_data(self, detach: bool = False) -> None:
+        """Clear all captured data.
+
+        Args:
+            detach: Also remove the page listeners (see teardown())
+        """
+        if detach:
+            self.teardown()
+        self._reset_buffers()
         logger.debug("extractor_data_cleared")
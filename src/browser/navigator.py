@@ -2,18 +2,135 @@
 
 This module provides utilities for navigating web pages with human-like
 behaviors including random delays, scrolling patterns, and overlay dismissal.
+The helpers are plain module-level coroutines; ``Navigator`` re-exports them
+for callers using the class-based API.
 """
 
 import asyncio
+import json
+import logging
 import random
-from typing import Literal
+from collections import deque
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from typing import Any, Literal
 
 import structlog
-from playwright.async_api import Page
+from playwright.async_api import BrowserContext, Locator, Page, Route
 from playwright.async_api import TimeoutError as PlaywrightTimeoutError
 
 logger = structlog.get_logger(__name__)
 
+# Private generator plus a pool of unit samples, refilled in batches, so delay
+# jitter doesn't draw on the shared module-level generator once per call
+_rng = random.Random()
+_DELAY_POOL_SIZE = 1024
+
+# Cookie consent buttons, matched by label or by container. Labels are compared
+# case-insensitively against the start of the button text, mirroring
+# Playwright's :has-text() without leaving the page.
+_COOKIE_LABELS = ("accept", "accept all", "i accept", "i agree", "ok", "got it")
+_COOKIE_SELECTORS = (
+    "[class*='cookie'] button",
+    "[class*='consent'] button",
+    "[id*='cookie'] button",
+    "[id*='consent'] button",
+)
+
+# Overlay elements removed from the DOM when dismissing aggressively
+_OVERLAY_SELECTORS = (
+    "[class*='modal']",
+    "[class*='popup']",
+    "[class*='overlay']",
+    "[class*='cookie']",
+    "[class*='consent']",
+    "[id*='modal']",
+    "[id*='popup']",
+    "[id*='overlay']",
+)
+
+# Overlay roots hidden by the injected style sheet; a single combined query
+# for them decides whether the aggressive pass is needed at all
+_HIDDEN_OVERLAY_SELECTORS = (*_OVERLAY_SELECTORS, "[id*='cookie']", "[id*='consent']")
+_OVERLAY_PROBE_SELECTOR = ",".join(_HIDDEN_OVERLAY_SELECTORS)
+
+_OVERLAY_STYLE = ",\n".join(_HIDDEN_OVERLAY_SELECTORS) + """ {
+    display: none !important;
+    pointer-events: none !important;
+}
+body {
+    overflow: auto !important;
+}
+"""
+
+# Runs a whole scroll sequence in the page, pausing between steps, so the
+# reading simulation costs one round-trip instead of one per scroll
+_SCROLL_JS = """
+async (steps) => {
+    for (const [amount, pauseMs] of steps) {
+        window.scrollBy(0, amount);
+        await new Promise((resolve) => setTimeout(resolve, pauseMs));
+    }
+}
+"""
+
+# Clicks the first visible consent button and, when ``remove`` is set and any
+# overlay root is present, strips large overlay elements in the same
+# round-trip. The selector lists are baked into the source so each call only
+# ships a boolean.
+_DISMISS_OVERLAYS_JS = f"""
+(remove) => {{
+    const labels = {json.dumps(_COOKIE_LABELS)};
+    const selectors = {json.dumps(_COOKIE_SELECTORS)};
+    const overlaySelector = {json.dumps(",".join(_OVERLAY_SELECTORS))};
+    const probeSelector = {json.dumps(_OVERLAY_PROBE_SELECTOR)};
+    const visible = (el) =>
+        el.offsetParent !== null || el.getClientRects().length > 0;
+
+    let clicked = null;
+    // Read each button's label once; visibility needs layout, so it is
+    // only checked for buttons whose label already matches
+    const buttons = [...document.querySelectorAll('button')].map(
+        (b) => [b, b.textContent.trim().toLowerCase()]);
+    for (const label of labels) {{
+        const match = buttons.find(([b, text]) => text.startsWith(label) && visible(b));
+        if (match) {{
+            match[0].click();
+            clicked = label;
+            break;
+        }}
+    }}
+    if (clicked === null) {{
+        for (const selector of selectors) {{
+            const el = [...document.querySelectorAll(selector)].find(visible);
+            if (el) {{
+                el.click();
+                clicked = selector;
+                break;
+            }}
+        }}
+    }}
+
+    let removed = 0;
+    const overlays = remove && document.querySelector(probeSelector) !== null;
+    if (overlays) {{
+        // Only remove elements taking up significant screen space. Sizes are
+        // all read before anything is removed so layout is computed once.
+        const large = [...document.querySelectorAll(overlaySelector)].filter(
+            (el) => el.clientWidth > 200 || el.clientHeight > 200);
+        for (const el of large) {{
+            el.remove();
+            removed++;
+        }}
+
+        // Re-enable body scrolling
+        document.body.style.overflow = 'auto';
+    }}
+
+    return {{clicked, removed, overlays}};
+}}
+"""
+
 
 class NavigationError(Exception):
     """Raised when navigation operations fail."""
@@ -21,457 +138,881 @@ class NavigationError(Exception):
     pass
 
 
-class Navigator:
-    """Handles page navigation with anti-detection and human behavior simulation.
+# Timing constants for human-like behavior (in seconds)
+MIN_DELAY = 1.0
+MAX_DELAY = 2.5
+MIN_CHAR_DELAY_MS = 80
+MAX_CHAR_DELAY_MS = 200
+SCROLL_PAUSE_MIN = 0.5
+SCROLL_PAUSE_MAX = 1.5
+MIN_TYPING_CHUNKS = 3
+MAX_TYPING_CHUNKS = 5
+MAX_TYPED_LENGTH = 25  # Longer values are filled at once, like a paste
 
-    This class provides methods for navigating pages, filling forms, and
-    interacting with elements in ways that mimic human behavior patterns
-    to avoid detection.
-    """
+# Unit samples for delay jitter, refilled in batches from _rng
+_delay_pool: deque[float] = deque()
 
-    # Timing constants for human-like behavior (in seconds)
-    MIN_DELAY = 1.0
-    MAX_DELAY = 2.5
-    MIN_CHAR_DELAY_MS = 80
-    MAX_CHAR_DELAY_MS = 200
-    SCROLL_PAUSE_MIN = 0.5
-    SCROLL_PAUSE_MAX = 1.5
+# Resource types aborted by install_resource_blocker unless told otherwise
+BLOCKED_RESOURCE_TYPES = frozenset({"image", "font", "media"})
 
-    @staticmethod
-    def _random_delay(min_seconds: float = MIN_DELAY, max_seconds: float = MAX_DELAY) -> float:
-        """Generate random delay in seconds.
+# Per-page state keyed by page id, dropped when the page closes
+_locators: dict[tuple[int, str], Locator] = {}
+_blocking_pages: set[int] = set()
+_watched_pages: set[int] = set()
 
-        Args:
-            min_seconds: Minimum delay
-            max_seconds: Maximum delay
 
-        Returns:
-            float: Random delay value
-        """
-        return random.uniform(min_seconds, max_seconds)
+def _random_delay(min_seconds: float = MIN_DELAY, max_seconds: float = MAX_DELAY) -> float:
+    """Generate random delay in seconds.
 
-    @staticmethod
-    async def _human_delay(min_seconds: float = MIN_DELAY, max_seconds: float = MAX_DELAY) -> None:
-        """Sleep for random human-like duration.
+    Args:
+        min_seconds: Minimum delay
+        max_seconds: Maximum delay
 
-        Args:
-            min_seconds: Minimum delay in seconds
-            max_seconds: Maximum delay in seconds
-        """
-        delay = Navigator._random_delay(min_seconds, max_seconds)
+    Returns:
+        float: Random delay value
+    """
+    pool = _delay_pool
+    if not pool:
+        pool.extend(_rng.random() for _ in range(_DELAY_POOL_SIZE))
+    return min_seconds + (max_seconds - min_seconds) * pool.pop()
+
+
+def _typing_chunks(value: str) -> list[str]:
+    """Split a value into a few chunks to type with varying key delays.
+
+    Args:
+        value: Text to be typed
+
+    Returns:
+        list[str]: Consecutive chunks that join back to ``value``
+    """
+    count = min(
+        len(value),
+        random.randint(MIN_TYPING_CHUNKS, MAX_TYPING_CHUNKS),
+    )
+    if count == 0:
+        return []
+    size = -(-len(value) // count)
+    return [value[i:i + size] for i in range(0, len(value), size)]
+
+
+async def _human_delay(min_seconds: float = MIN_DELAY, max_seconds: float = MAX_DELAY) -> None:
+    """Sleep for random human-like duration.
+
+    Args:
+        min_seconds: Minimum delay in seconds
+        max_seconds: Maximum delay in seconds
+    """
+    delay = _random_delay(min_seconds, max_seconds)
+    if logger.is_enabled_for(logging.DEBUG):
         logger.debug("human_delay", delay_seconds=delay)
-        await asyncio.sleep(delay)
+    await asyncio.sleep(delay)
 
-    @staticmethod
-    async def navigate_with_human_behavior(
-        page: Page,
-        url: str,
-        wait_until: Literal["domcontentloaded", "networkidle", "load"] = "domcontentloaded",
-    ) -> bool:
-        """Navigate to URL with human-like delays and scrolling.
 
-        Args:
-            page: Playwright Page instance
-            url: Target URL
-            wait_until: Wait strategy for navigation
+def _forget_page(page: Page) -> None:
+    """Drop memoized locators and routing state belonging to a closed page.
 
-        Returns:
-            bool: True if navigation successful
+    Args:
+        page: Playwright Page instance
+    """
+    page_id = id(page)
+    for key in [k for k in _locators if k[0] == page_id]:
+        del _locators[key]
+    _blocking_pages.discard(page_id)
+    _watched_pages.discard(page_id)
 
-        Raises:
-            NavigationError: If navigation fails
-        """
-        try:
-            # Random delay before navigation (simulate thinking time)
-            await Navigator._human_delay(1.0, 2.5)
 
-            logger.info("navigating_with_human_behavior", url=url, wait_until=wait_until)
+def _watch_page(page: Page) -> None:
+    """Register the close listener that clears a page's cached state.
+
+    Args:
+        page: Playwright Page instance
+    """
+    if id(page) not in _watched_pages:
+        _watched_pages.add(id(page))
+        page.on("close", _forget_page)
+
+
+def locator(page: Page, selector: str) -> Locator:
+    """Get a reusable locator for the first element matching a selector.
+
+    Locators resolve lazily on each action, so they stay valid across
+    navigations and are memoized for the lifetime of the page.
 
-            # Navigate to URL
-            response = await page.goto(url, wait_until=wait_until, timeout=30000)
+    Args:
+        page: Playwright Page instance
+        selector: CSS selector for element
+
+    Returns:
+        Locator: Locator for the first matching element
+    """
+    key = (id(page), selector)
+    loc = _locators.get(key)
+    if loc is None:
+        _watch_page(page)
+        loc = _locators[key] = page.locator(selector).first
+    return loc
+
+
+async def install_resource_blocker(
+    page: Page,
+    block: frozenset[str] = BLOCKED_RESOURCE_TYPES,
+) -> None:
+    """Abort requests for resource types that don't matter to testing.
+
+    Images, fonts and media dominate page weight but rarely affect the DOM
+    under test; dropping them lets load states settle much sooner. For
+    locally launched Chromium, ``--disable-gpu`` and
+    ``--disable-dev-shm-usage`` are the usual companion launch flags.
+    Installing twice on the same page is a no-op.
+
+    Args:
+        page: Playwright Page instance
+        block: Playwright resource types to abort
+    """
+    if id(page) in _blocking_pages:
+        return
+
+    async def handle(route: Route) -> None:
+        if route.request.resource_type in block:
+            await route.abort()
+        else:
+            await route.continue_()
+
+    await page.route("**/*", handle)
+    _watch_page(page)
+    _blocking_pages.add(id(page))
+    logger.debug("resource_blocker_installed", blocked=sorted(block))
+
+
+async def navigate_with_human_behavior(
+    page: Page,
+    url: str,
+    wait_until: Literal["domcontentloaded", "networkidle", "load", "commit"] = "domcontentloaded",
+    ready_selector: str | None = None,
+    block_resources: bool = False,
+) -> bool:
+    """Navigate to URL with human-like delays and scrolling.
+
+    Args:
+        page: Playwright Page instance
+        url: Target URL
+        wait_until: Wait strategy for navigation
+        ready_selector: Optional selector signalling the page is usable
+        block_resources: Abort image, font and media requests on this page
+
+    Returns:
+        bool: True if navigation successful
+
+    Raises:
+        NavigationError: If navigation fails
+    """
+    log = logger.bind(url=url)
+
+    try:
+        if block_resources:
+            await install_resource_blocker(page)
+
+        # Random delay before navigation (simulate thinking time)
+        await _human_delay(1.0, 2.5)
+
+        log.info("navigating_with_human_behavior", wait_until=wait_until)
+
+        # Navigate to URL, returning as soon as the response is committed
+        response = await page.goto(url, wait_until="commit", timeout=30000)
+
+        if not response:
+            raise NavigationError(f"No response received for {url}")
+
+        if wait_until != "commit":
+            # Wait for the requested state separately so a slow parse is
+            # tolerated instead of failing the whole navigation
+            try:
+                await page.wait_for_load_state(wait_until, timeout=10000)
+            except PlaywrightTimeoutError:
+                log.debug("load_state_timeout", state=wait_until)
 
-            if not response:
-                raise NavigationError(f"No response received for {url}")
+            # Wait for the load event rather than network idle, which trackers
+            # and long-polling keep from ever settling
+            try:
+                await page.wait_for_load_state("load", timeout=5000)
+            except PlaywrightTimeoutError:
+                log.debug("load_timeout")
 
-            # Wait for network to settle
+        if ready_selector:
             try:
-                await page.wait_for_load_state("networkidle", timeout=10000)
+                await page.wait_for_selector(ready_selector, timeout=5000)
             except PlaywrightTimeoutError:
-                logger.debug("networkidle_timeout", url=url)
+                log.debug("ready_selector_timeout", selector=ready_selector)
 
-            # Random scrolling to simulate reading
-            await Navigator.random_scroll(page)
+        # Random scrolling to simulate reading
+        await random_scroll(page)
 
-            logger.info(
-                "navigation_complete",
-                url=url,
-                status=response.status,
-                final_url=page.url,
-            )
+        log.info(
+            "navigation_complete",
+            status=response.status,
+            final_url=page.url,
+        )
 
-            return True
+        return True
 
-        except PlaywrightTimeoutError as e:
-            logger.error("navigation_timeout", url=url, error=str(e))
-            raise NavigationError(f"Navigation timeout for {url}: {e}") from e
-        except Exception as e:
-            logger.error("navigation_failed", url=url, error=str(e), error_type=type(e).__name__)
-            raise NavigationError(f"Navigation to {url} failed: {e}") from e
+    except PlaywrightTimeoutError as e:
+        log.error("navigation_timeout", error=str(e))
+        raise NavigationError(f"Navigation timeout for {url}: {e}") from e
+    except Exception as e:
+        log.error("navigation_failed", error=str(e), error_type=type(e).__name__)
+        raise NavigationError(f"Navigation to {url} failed: {e}") from e
 
-    @staticmethod
-    async def random_scroll(page: Page, num_scrolls: int = 3) -> None:
-        """Perform random scrolling to simulate human reading behavior.
 
-        Args:
-            page: Playwright Page instance
-            num_scrolls: Number of scroll actions to perform
-        """
-        try:
-            for i in range(num_scrolls):
-                # Random scroll amount (100-500 pixels)
-                scroll_amount = random.randint(100, 500)
+async def process_urls(
+    pages: list[Page],
+    urls: list[str],
+    concurrency: int = 5,
+    wait_until: Literal["domcontentloaded", "networkidle", "load", "commit"] = "domcontentloaded",
+) -> list[tuple[str, bool]]:
+    """Navigate to many URLs concurrently across a set of pages.
 
-                # Scroll down
-                await page.evaluate(f"window.scrollBy(0, {scroll_amount})")
+    Each page handles one navigation at a time, so the effective
+    concurrency is capped by the number of pages supplied.
 
-                # Pause like human reading
-                await Navigator._human_delay(
-                    Navigator.SCROLL_PAUSE_MIN,
-                    Navigator.SCROLL_PAUSE_MAX,
-                )
+    Args:
+        pages: Playwright Page instances to spread navigations across
+        urls: URLs to visit
+        concurrency: Maximum number of navigations in flight
+        wait_until: Wait strategy for each navigation
 
-            logger.debug("random_scroll_complete", scrolls=num_scrolls)
+    Returns:
+        list[tuple[str, bool]]: (url, success) pairs in input order
 
-        except Exception as e:
-            logger.warning("random_scroll_failed", error=str(e))
+    Raises:
+        ValueError: If no pages are provided
+    """
+    if not pages:
+        raise ValueError("At least one page is required")
 
-    @staticmethod
-    async def fill_form(
-        page: Page,
-        selector: str,
-        value: str,
-        delay_between_chars: bool = True,
-    ) -> bool:
-        """Type into form field with character delays to simulate human typing.
+    semaphore = asyncio.Semaphore(concurrency)
+    idle_pages: asyncio.Queue[Page] = asyncio.Queue()
+    for page in pages:
+        idle_pages.put_nowait(page)
 
-        Args:
-            page: Playwright Page instance
-            selector: CSS selector for input field
-            value: Value to type
-            delay_between_chars: Add random delay between characters
+    async def visit(url: str) -> tuple[str, bool]:
+        async with semaphore:
+            page = await idle_pages.get()
+            try:
+                await navigate_with_human_behavior(page, url, wait_until)
+                return url, True
+            except NavigationError:
+                # Already logged by navigate_with_human_behavior
+                return url, False
+            finally:
+                idle_pages.put_nowait(page)
 
-        Returns:
-            bool: True if successful
+    results = await asyncio.gather(*(visit(url) for url in urls))
 
-        Raises:
-            NavigationError: If form filling fails
-        """
-        try:
-            # Wait for element to be visible
-            await page.wait_for_selector(selector, state="visible", timeout=5000)
-
-            # Click to focus
-            await page.click(selector)
-
-            # Small delay after clicking
-            await Navigator._human_delay(0.2, 0.5)
-
-            if delay_between_chars:
-                # Type with character delays
-                for char in value:
-                    await page.type(selector, char, delay=random.randint(
-                        Navigator.MIN_CHAR_DELAY_MS,
-                        Navigator.MAX_CHAR_DELAY_MS,
-                    ))
-            else:
-                # Type all at once
-                await page.fill(selector, value)
-
-            logger.info("form_field_filled", selector=selector, length=len(value))
-            return True
-
-        except PlaywrightTimeoutError as e:
-            logger.error("form_field_timeout", selector=selector, error=str(e))
-            raise NavigationError(f"Form field not found: {selector}") from e
-        except Exception as e:
-            logger.error("form_fill_failed", selector=selector, error=str(e))
-            raise NavigationError(f"Failed to fill form field {selector}: {e}") from e
+    logger.info(
+        "process_urls_complete",
+        total=len(urls),
+        succeeded=sum(1 for _, ok in results if ok),
+        concurrency=min(concurrency, len(pages)),
+    )
 
-    @staticmethod
-    async def click_element(
-        page: Page,
-        selector: str,
-        wait_for_navigation: bool = False,
-    ) -> bool:
-        """Click element with human-like behavior.
+    return list(results)
 
-        Args:
-            page: Playwright Page instance
-            selector: CSS selector for element
-            wait_for_navigation: Wait for navigation after click
 
-        Returns:
-            bool: True if successful
+def _scroll_steps(num_scrolls: int) -> list[tuple[int, int]]:
+    """Draw scroll amounts and reading pauses for a scroll sequence.
 
-        Raises:
-            NavigationError: If click fails
-        """
-        try:
-            # Wait for element
-            await page.wait_for_selector(selector, state="visible", timeout=5000)
+    Args:
+        num_scrolls: Number of scroll actions to perform
 
-            # Random delay before clicking
-            await Navigator._human_delay(0.3, 0.8)
+    Returns:
+        list[tuple[int, int]]: (pixels, pause_ms) per scroll
+    """
+    # Random scroll amount (100-500 pixels) and reading pause per step
+    return [
+        (
+            random.randint(100, 500),
+            int(_random_delay(SCROLL_PAUSE_MIN, SCROLL_PAUSE_MAX) * 1000),
+        )
+        for _ in range(num_scrolls)
+    ]
+
+
+async def random_scroll(page: Page, num_scrolls: int = 3) -> None:
+    """Perform random scrolling to simulate human reading behavior.
+
+    Args:
+        page: Playwright Page instance
+        num_scrolls: Number of scroll actions to perform
+    """
+    try:
+        await page.evaluate(_SCROLL_JS, _scroll_steps(num_scrolls))
 
-            if wait_for_navigation:
-                # Click and wait for navigation
-                async with page.expect_navigation(timeout=10000):
-                    await page.click(selector)
-            else:
-                await page.click(selector)
+        logger.debug("random_scroll_complete", scrolls=num_scrolls)
 
-            logger.info("element_clicked", selector=selector)
-            return True
+    except Exception as e:
+        logger.warning("random_scroll_failed", error=str(e))
 
-        except PlaywrightTimeoutError as e:
-            logger.error("click_timeout", selector=selector, error=str(e))
-            raise NavigationError(f"Element not found: {selector}") from e
-        except Exception as e:
-            logger.error("click_failed", selector=selector, error=str(e))
-            raise NavigationError(f"Failed to click {selector}: {e}") from e
 
-    @staticmethod
-    async def dismiss_overlays(page: Page, aggressive: bool = True) -> bool:
-        """Nuclear cookie/modal removal to clean up page.
+async def fill_form(
+    page: Page,
+    selector: str,
+    value: str,
+    delay_between_chars: bool = True,
+    commit: bool = False,
+) -> bool:
+    """Type into form field with character delays to simulate human typing.
 
-        This method aggressively removes common overlays, modals, and popups
-        that might interfere with testing.
+    Values longer than ``MAX_TYPED_LENGTH`` are filled in one step, as a
+    person would paste them, since typing them adds latency without
+    making the interaction look any more natural.
 
-        Args:
-            page: Playwright Page instance
-            aggressive: Use aggressive removal tactics
+    Args:
+        page: Playwright Page instance
+        selector: CSS selector for input field
+        value: Value to type
+        delay_between_chars: Add random delay between characters
+        commit: Press Tab afterwards to blur the field and fire change events
 
-        Returns:
-            bool: True if any overlays were dismissed
-        """
-        dismissed = False
+    Returns:
+        bool: True if successful
 
-        try:
-            logger.info("dismissing_overlays", aggressive=aggressive)
-
-            # Common cookie consent selectors
-            cookie_selectors = [
-                "button:has-text('Accept')",
-                "button:has-text('Accept all')",
-                "button:has-text('I accept')",
-                "button:has-text('I agree')",
-                "button:has-text('OK')",
-                "button:has-text('Got it')",
-                "[class*='cookie'] button",
-                "[class*='consent'] button",
-                "[id*='cookie'] button",
-                "[id*='consent'] button",
-            ]
-
-            # Try clicking cookie consent buttons
-            for selector in cookie_selectors:
-                try:
-                    elements = await page.query_selector_all(selector)
-                    for element in elements[:1]:  # Only click first match
-                        if await element.is_visible():
-                            await element.click(timeout=1000)
-                            dismissed = True
-                            logger.info("cookie_button_clicked", selector=selector)
-                            await asyncio.sleep(0.5)
-                            break
-                except Exception:
-                    pass
-
-            if aggressive:
-                # Nuclear option: Remove common overlay elements via CSS injection
-                await page.add_style_tag(content="""
-                    [class*='modal'],
-                    [class*='popup'],
-                    [class*='overlay'],
-                    [class*='cookie'],
-                    [class*='consent'],
-                    [id*='modal'],
-                    [id*='popup'],
-                    [id*='overlay'],
-                    [id*='cookie'],
-                    [id*='consent'] {
-                        display: none !important;
-                        pointer-events: none !important;
-                    }
-                    body {
-                        overflow: auto !important;
-                    }
-                """)
-
-                # Remove elements directly from DOM
-                removed_count = await page.evaluate("""
-                    () => {
-                        const selectors = [
-                            '[class*="modal"]',
-                            '[class*="popup"]',
-                            '[class*="overlay"]',
-                            '[class*="cookie"]',
-                            '[class*="consent"]',
-                            '[id*="modal"]',
-                            '[id*="popup"]',
-                            '[id*="overlay"]'
-                        ];
-
-                        let count = 0;
-                        for (const selector of selectors) {
-                            const elements = document.querySelectorAll(selector);
-                            elements.forEach(el => {
-                                // Only remove if it's taking up significant screen space
-                                const rect = el.getBoundingClientRect();
-                                if (rect.width > 200 || rect.height > 200) {
-                                    el.remove();
-                                    count++;
-                                }
-                            });
-                        }
-
-                        // Re-enable body scrolling
-                        document.body.style.overflow = 'auto';
-
-                        return count;
-                    }
-                """)
-
-                if removed_count > 0:
-                    dismissed = True
-                    logger.info("overlays_removed", count=removed_count)
-
-            # Wait a moment for page to stabilize
-            await asyncio.sleep(0.5)
-
-            logger.info("overlay_dismissal_complete", dismissed=dismissed)
-            return dismissed
+    Raises:
+        NavigationError: If form filling fails
+    """
+    log = logger.bind(selector=selector)
+
+    try:
+        # Wait for element to be visible
+        loc = locator(page, selector)
+        await loc.wait_for(state="visible", timeout=5000)
+
+        # Click to focus
+        await loc.click()
+
+        # Small delay after clicking
+        await _human_delay(0.2, 0.5)
+
+        if delay_between_chars and len(value) <= MAX_TYPED_LENGTH:
+            # Type in a few chunks, each with its own per-key delay, so the
+            # rhythm varies without a round-trip per character
+            for chunk in _typing_chunks(value):
+                await loc.press_sequentially(chunk, delay=random.randint(
+                    MIN_CHAR_DELAY_MS,
+                    MAX_CHAR_DELAY_MS,
+                ))
+        else:
+            # Type all at once
+            await loc.fill(value)
+
+        if commit:
+            await loc.press("Tab")
+
+        log.info("form_field_filled", length=len(value))
+        return True
+
+    except PlaywrightTimeoutError as e:
+        log.error("form_field_timeout", error=str(e))
+        raise NavigationError(f"Form field not found: {selector}") from e
+    except Exception as e:
+        log.error("form_fill_failed", error=str(e))
+        raise NavigationError(f"Failed to fill form field {selector}: {e}") from e
+
+
+async def click_element(
+    page: Page,
+    selector: str,
+    wait_for_navigation: bool = False,
+) -> bool:
+    """Click element with human-like behavior.
+
+    Args:
+        page: Playwright Page instance
+        selector: CSS selector for element
+        wait_for_navigation: Wait for navigation after click
+
+    Returns:
+        bool: True if successful
+
+    Raises:
+        NavigationError: If click fails
+    """
+    log = logger.bind(selector=selector)
 
-        except Exception as e:
-            logger.warning("overlay_dismissal_failed", error=str(e))
-            return dismissed
-
-    @staticmethod
-    async def wait_for_element(
-        page: Page,
-        selector: str,
-        timeout_ms: int = 5000,
-        state: Literal["attached", "detached", "visible", "hidden"] = "visible",
-    ) -> bool:
-        """Wait for element to reach specified state.
+    try:
+        # Wait for element
+        loc = locator(page, selector)
+        await loc.wait_for(state="visible", timeout=5000)
+
+        # Random delay before clicking
+        await _human_delay(0.3, 0.8)
+
+        if wait_for_navigation:
+            # Click and wait for navigation
+            async with page.expect_navigation(timeout=10000):
+                await loc.click()
+        else:
+            await loc.click()
+
+        log.info("element_clicked")
+        return True
+
+    except PlaywrightTimeoutError as e:
+        log.error("click_timeout", error=str(e))
+        raise NavigationError(f"Element not found: {selector}") from e
+    except Exception as e:
+        log.error("click_failed", error=str(e))
+        raise NavigationError(f"Failed to click {selector}: {e}") from e
+
+
+async def _finish_dismissal(page: Page, result: dict[str, Any]) -> bool:
+    """Log the in-page dismissal result and hide overlays that may return.
+
+    Args:
+        page: Playwright Page instance
+        result: Value returned by the dismissal script
+
+    Returns:
+        bool: True if any overlays were dismissed
+    """
+    dismissed = False
+
+    if result["clicked"]:
+        dismissed = True
+        logger.info("cookie_button_clicked", selector=result["clicked"])
+
+    if result["removed"] > 0:
+        dismissed = True
+        logger.info("overlays_removed", count=result["removed"])
+
+    if result["overlays"]:
+        # Nuclear option: keep any re-inserted overlays hidden via CSS injection
+        await page.add_style_tag(content=_OVERLAY_STYLE)
+
+    # Give scripts reacting to the dismissal a moment to settle; the
+    # injected style applies synchronously, so clean pages skip this
+    if dismissed:
+        await asyncio.sleep(0.2)
+
+    logger.info("overlay_dismissal_complete", dismissed=dismissed)
+    return dismissed
+
+
+async def dismiss_overlays(page: Page, aggressive: bool = True) -> bool:
+    """Nuclear cookie/modal removal to clean up page.
+
+    This method aggressively removes common overlays, modals, and popups
+    that might interfere with testing.
+
+    Args:
+        page: Playwright Page instance
+        aggressive: Use aggressive removal tactics
+
+    Returns:
+        bool: True if any overlays were dismissed
+    """
+    try:
+        logger.info("dismissing_overlays", aggressive=aggressive)
+
+        # Click the first visible consent button and, when aggressive and
+        # overlays are present, strip them from the DOM in the same round-trip
+        result = await page.evaluate(_DISMISS_OVERLAYS_JS, aggressive)
+
+        return await _finish_dismissal(page, result)
+
+    except Exception as e:
+        logger.warning("overlay_dismissal_failed", error=str(e))
+        return False
+
+
+async def wait_for_element(
+    page: Page,
+    selector: str,
+    timeout_ms: int = 5000,
+    state: Literal["attached", "detached", "visible", "hidden"] = "visible",
+) -> bool:
+    """Wait for element to reach specified state.
+
+    Args:
+        page: Playwright Page instance
+        selector: CSS selector
+        timeout_ms: Timeout in milliseconds
+        state: Element state to wait for
+
+    Returns:
+        bool: True if element reached desired state
+
+    Raises:
+        NavigationError: If timeout occurs
+    """
+    log = logger.bind(selector=selector)
+
+    try:
+        await locator(page, selector).wait_for(state=state, timeout=timeout_ms)
+        log.debug("element_ready", state=state)
+        return True
+
+    except PlaywrightTimeoutError as e:
+        log.error(
+            "wait_for_element_timeout",
+            state=state,
+            timeout_ms=timeout_ms,
+        )
+        raise NavigationError(
+            f"Element {selector} did not reach {state} state within {timeout_ms}ms"
+        ) from e
+
+
+async def hover_element(page: Page, selector: str) -> bool:
+    """Hover over element with human-like behavior.
+
+    Args:
+        page: Playwright Page instance
+        selector: CSS selector for element
+
+    Returns:
+        bool: True if successful
+
+    Raises:
+        NavigationError: If hover fails
+    """
+    log = logger.bind(selector=selector)
+
+    try:
+        # Wait for element
+        loc = locator(page, selector)
+        await loc.wait_for(state="visible", timeout=5000)
+
+        # Random delay before hovering
+        await _human_delay(0.2, 0.6)
+
+        # Hover
+        await loc.hover()
+
+        log.debug("element_hovered")
+        return True
+
+    except PlaywrightTimeoutError as e:
+        log.error("hover_timeout", error=str(e))
+        raise NavigationError(f"Element not found: {selector}") from e
+    except Exception as e:
+        log.error("hover_failed", error=str(e))
+        raise NavigationError(f"Failed to hover {selector}: {e}") from e
+
+
+async def select_option(
+    page: Page,
+    selector: str,
+    value: str | None = None,
+    label: str | None = None,
+) -> bool:
+    """Select option from dropdown.
+
+    Args:
+        page: Playwright Page instance
+        selector: CSS selector for select element
+        value: Option value to select
+        label: Option label text to select
+
+    Returns:
+        bool: True if successful
+
+    Raises:
+        ValueError: If neither value nor label is provided
+        NavigationError: If selection fails
+    """
+    # Validate before try block so ValueError isn't caught
+    if value is None and label is None:
+        raise ValueError("Either value or label must be provided")
+
+    log = logger.bind(selector=selector)
+
+    try:
+        # Wait for select element
+        loc = locator(page, selector)
+        await loc.wait_for(state="visible", timeout=5000)
+
+        # Random delay before selecting
+        await _human_delay(0.3, 0.7)
+
+        # Select option
+        if value is not None:
+            await loc.select_option(value=value)
+        else:
+            await loc.select_option(label=label)
+
+        log.info("option_selected", value=value, label=label)
+        return True
+
+    except PlaywrightTimeoutError as e:
+        log.error("select_timeout", error=str(e))
+        raise NavigationError(f"Select element not found: {selector}") from e
+    except Exception as e:
+        log.error("select_failed", error=str(e))
+        raise NavigationError(f"Failed to select option in {selector}: {e}") from e
+
+
+class _Batch:
+    """Collects Navigator page scripts and runs them in one evaluate call.
+
+    Steps run in the order they were added. After the block exits,
+    ``results`` maps each step name to the value the matching Navigator
+    function would have returned.
+    """
+
+    def __init__(self, page: Page) -> None:
+        """Initialize batch.
 
         Args:
             page: Playwright Page instance
-            selector: CSS selector
-            timeout_ms: Timeout in milliseconds
-            state: Element state to wait for
+        """
+        self.page = page
+        self.results: dict[str, Any] = {}
+        self._steps: list[tuple[str, str, Any]] = []
 
-        Returns:
-            bool: True if element reached desired state
+    def add(self, name: str, script: str, arg: Any = None) -> None:
+        """Queue a page function expression to run with ``arg``.
+
+        Args:
+            name: Key for the step's result
+            script: JavaScript function expression taking one argument
+            arg: Serializable argument passed to the function
 
         Raises:
-            NavigationError: If timeout occurs
+            ValueError: If a step with the same name was already added
         """
-        try:
-            await page.wait_for_selector(selector, state=state, timeout=timeout_ms)
-            logger.debug("element_ready", selector=selector, state=state)
-            return True
-
-        except PlaywrightTimeoutError as e:
-            logger.error(
-                "wait_for_element_timeout",
-                selector=selector,
-                state=state,
-                timeout_ms=timeout_ms,
-            )
-            raise NavigationError(
-                f"Element {selector} did not reach {state} state within {timeout_ms}ms"
-            ) from e
-
-    @staticmethod
-    async def hover_element(page: Page, selector: str) -> bool:
-        """Hover over element with human-like behavior.
+        if any(step[0] == name for step in self._steps):
+            raise ValueError(f"Batch step {name!r} already added")
+        self._steps.append((name, script, arg))
 
-        Args:
-            page: Playwright Page instance
-            selector: CSS selector for element
+    def dismiss_overlays(self, aggressive: bool = True) -> None:
+        """Queue overlay dismissal; see ``dismiss_overlays``."""
+        self.add("dismiss_overlays", _DISMISS_OVERLAYS_JS, aggressive)
+
+    def random_scroll(self, num_scrolls: int = 3) -> None:
+        """Queue a random scroll sequence; see ``random_scroll``."""
+        self.add("random_scroll", _SCROLL_JS, _scroll_steps(num_scrolls))
+
+    async def run(self) -> dict[str, Any]:
+        """Run all queued steps in a single round-trip.
 
         Returns:
-            bool: True if successful
+            dict[str, Any]: Result per step name
 
         Raises:
-            NavigationError: If hover fails
+            NavigationError: If the combined script fails
         """
+        if not self._steps:
+            return self.results
+
+        script = (
+            "async (args) => {\n"
+            "    const steps = [\n"
+            + ",\n".join(step[1].strip() for step in self._steps)
+            + "\n    ];\n"
+            "    const results = [];\n"
+            "    for (let i = 0; i < steps.length; i++) {\n"
+            "        results.push(await steps[i](args[i]));\n"
+            "    }\n"
+            "    return results;\n"
+            "}"
+        )
+
         try:
-            # Wait for element
-            await page.wait_for_selector(selector, state="visible", timeout=5000)
+            values = await self.page.evaluate(script, [step[2] for step in self._steps])
+        except Exception as e:
+            logger.error("navigator_batch_failed", steps=len(self._steps), error=str(e))
+            raise NavigationError(f"Batched page script failed: {e}") from e
 
-            # Random delay before hovering
-            await Navigator._human_delay(0.2, 0.6)
+        for (name, _, _), value in zip(self._steps, values, strict=True):
+            if name == "dismiss_overlays":
+                value = await _finish_dismissal(self.page, value)
+            self.results[name] = value
 
-            # Hover
-            await page.hover(selector)
+        logger.debug("navigator_batch_complete", steps=[step[0] for step in self._steps])
+        self._steps.clear()
+        return self.results
 
-            logger.debug("element_hovered", selector=selector)
-            return True
+    async def __aenter__(self) -> "_Batch":
+        """Async context manager entry."""
+        return self
 
-        except PlaywrightTimeoutError as e:
-            logger.error("hover_timeout", selector=selector, error=str(e))
-            raise NavigationError(f"Element not found: {selector}") from e
-        except Exception as e:
-            logger.error("hover_failed", selector=selector, error=str(e))
-            raise NavigationError(f"Failed to hover {selector}: {e}") from e
-
-    @staticmethod
-    async def select_option(
-        page: Page,
-        selector: str,
-        value: str | None = None,
-        label: str | None = None,
-    ) -> bool:
-        """Select option from dropdown.
+    async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        """Run queued steps unless the block raised."""
+        if exc_type is None:
+            await self.run()
+
+
+def batch(page: Page) -> _Batch:
+    """Start a batch that runs several page scripts in one round-trip.
+
+    Example:
+        ```python
+        async with Navigator.batch(page) as b:
+            b.dismiss_overlays()
+            b.random_scroll()
+        dismissed = b.results["dismiss_overlays"]
+        ```
+
+    Args:
+        page: Playwright Page instance
+
+    Returns:
+        _Batch: Batch to queue steps on
+    """
+    return _Batch(page)
+
+
+class PagePool:
+    """Pool of pre-warmed pages reused across navigations.
+
+    Opening a fresh page per URL pays page start-up cost on every visit.
+    The pool opens its pages once, hands them out one caller at a time, and
+    resets them to ``about:blank`` on release. Pages are replaced after
+    ``max_uses`` navigations to bound per-page memory growth.
+
+    Example:
+        ```python
+        async with PagePool(client.context, size=3) as pool:
+            async with pool.acquire() as page:
+                await navigate_with_human_behavior(page, url)
+        ```
+    """
+
+    def __init__(self, context: BrowserContext, size: int = 5, max_uses: int = 50) -> None:
+        """Initialize page pool.
 
         Args:
-            page: Playwright Page instance
-            selector: CSS selector for select element
-            value: Option value to select
-            label: Option label text to select
+            context: Browser context to open pages in
+            size: Number of pages kept in the pool
+            max_uses: Acquisitions after which a page is replaced
+        """
+        self.context = context
+        self.size = size
+        self.max_uses = max_uses
+        self._idle: asyncio.Queue[Page] = asyncio.Queue(maxsize=size)
+        self._uses: dict[int, int] = {}
+        self._closed = False
+
+    async def init(self) -> None:
+        """Open the pool's pages."""
+        pages = await asyncio.gather(*(self.context.new_page() for _ in range(self.size)))
+        for page in pages:
+            self._uses[id(page)] = 0
+            self._idle.put_nowait(page)
+
+        logger.info("page_pool_ready", size=self.size)
+
+    @asynccontextmanager
+    async def acquire(self) -> AsyncIterator[Page]:
+        """Borrow a page, waiting until one is free.
+
+        Yields:
+            Page: Page reserved for the caller until the block exits
+        """
+        page = await self._idle.get()
+        try:
+            yield page
+        finally:
+            await self._release(page)
 
-        Returns:
-            bool: True if successful
+    async def _release(self, page: Page) -> None:
+        """Reset a returned page, or replace it once worn out or broken.
 
-        Raises:
-            ValueError: If neither value nor label is provided
-            NavigationError: If selection fails
+        Args:
+            page: Page being returned to the pool
         """
-        # Validate before try block so ValueError isn't caught
-        if value is None and label is None:
-            raise ValueError("Either value or label must be provided")
+        if self._closed:
+            await self._close_page(page)
+            return
 
+        uses = self._uses.pop(id(page), 0) + 1
+        if uses < self.max_uses and not page.is_closed():
+            try:
+                await page.goto("about:blank")
+                self._uses[id(page)] = uses
+                self._idle.put_nowait(page)
+                return
+            except Exception as e:
+                logger.warning("page_pool_reset_failed", error=str(e))
+
+        await self._close_page(page)
         try:
-            # Wait for select element
-            await page.wait_for_selector(selector, state="visible", timeout=5000)
+            page = await self.context.new_page()
+        except Exception as e:
+            logger.error("page_pool_replace_failed", error=str(e))
+            raise
+        self._uses[id(page)] = 0
+        self._idle.put_nowait(page)
+        logger.debug("page_pool_page_recycled", uses=uses)
 
-            # Random delay before selecting
-            await Navigator._human_delay(0.3, 0.7)
+    async def _close_page(self, page: Page) -> None:
+        """Close a page, ignoring failures from already-dead pages.
 
-            # Select option
-            if value is not None:
-                await page.select_option(selector, value=value)
-            else:
-                await page.select_option(selector, label=label)
+        Args:
+            page: Page to close
+        """
+        self._uses.pop(id(page), None)
+        try:
+            await page.close()
+        except Exception as e:
+            logger.debug("page_pool_close_failed", error=str(e))
 
-            logger.info("option_selected", selector=selector, value=value, label=label)
-            return True
+    async def close(self) -> None:
+        """Close idle pages; pages still in use are closed when released."""
+        self._closed = True
+        while not self._idle.empty():
+            await self._close_page(self._idle.get_nowait())
 
-        except PlaywrightTimeoutError as e:
-            logger.error("select_timeout", selector=selector, error=str(e))
-            raise NavigationError(f"Select element not found: {selector}") from e
-        except Exception as e:
-            logger.error("select_failed", selector=selector, error=str(e))
-            raise NavigationError(f"Failed to select option in {selector}: {e}") from e
+        logger.info("page_pool_closed")
+
+    async def __aenter__(self) -> "PagePool":
+        """Async context manager entry."""
+        await self.init()
+        return self
+
+    async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        """Async context manager exit."""
+        await self.close()
+
+
+class Navigator:
+    """Handles page navigation with anti-detection and human behavior simulation.
+
+    The helpers live at module level; this class re-exports them so existing
+    ``Navigator.<name>(...)`` callers keep working unchanged.
+    """
+
+    MIN_DELAY = MIN_DELAY
+    MAX_DELAY = MAX_DELAY
+    MIN_CHAR_DELAY_MS = MIN_CHAR_DELAY_MS
+    MAX_CHAR_DELAY_MS = MAX_CHAR_DELAY_MS
+    SCROLL_PAUSE_MIN = SCROLL_PAUSE_MIN
+    SCROLL_PAUSE_MAX = SCROLL_PAUSE_MAX
+    MIN_TYPING_CHUNKS = MIN_TYPING_CHUNKS
+    MAX_TYPING_CHUNKS = MAX_TYPING_CHUNKS
+    MAX_TYPED_LENGTH = MAX_TYPED_LENGTH
+    BLOCKED_RESOURCE_TYPES = BLOCKED_RESOURCE_TYPES
+
+    _delay_pool = _delay_pool
+    _locators = _locators
+    _blocking_pages = _blocking_pages
+    _watched_pages = _watched_pages
+
+    _random_delay = staticmethod(_random_delay)
+    _typing_chunks = staticmethod(_typing_chunks)
+    _human_delay = staticmethod(_human_delay)
+    _forget_page = staticmethod(_forget_page)
+    _watch_page = staticmethod(_watch_page)
+    locator = staticmethod(locator)
+    install_resource_blocker = staticmethod(install_resource_blocker)
+    navigate_with_human_behavior = staticmethod(navigate_with_human_behavior)
+    process_urls = staticmethod(process_urls)
+    random_scroll = staticmethod(random_scroll)
+    fill_form = staticmethod(fill_form)
+    click_element = staticmethod(click_element)
+    dismiss_overlays = staticmethod(dismiss_overlays)
+    wait_for_element = staticmethod(wait_for_element)
+    hover_element = staticmethod(hover_element)
+    select_option = staticmethod(select_option)
+    batch = staticmethod(batch)
@@ -1,31 +1,74 @@
 """BugHive CLI - Main entry point for command-line interface."""
 
 import asyncio
+import re
 import uuid
 from datetime import datetime
+from functools import lru_cache
 from typing import Optional
 
 import click
+import orjson
 from rich.console import Console
 from rich.table import Table
-from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TimeElapsedColumn
 from rich.panel import Panel
-from rich.markdown import Markdown
-from rich.live import Live
 from rich import box
 
-console = Console()
+from src.core.config import get_settings as _get_settings
+
+try:
+    from uvloop import run as _uvloop_run
+except ImportError:
+    # uvloop isn't available on every platform, and run() only exists from
+    # uvloop 0.18 on; fall back to the default loop
+    _uvloop_run = None
+
+# protocol, optional "user:pass@" credentials, and the rest of the URL
+_URL_MASK_RE = re.compile(r"^([^:]+)://([^@]*@)?(.*)$", re.DOTALL)
+
+_STATUS_EMOJI = {
+    "pending": "⏳",
+    "running": "🔄",
+    "completed": "✓",
+    "failed": "✗",
+    "cancelled": "⊘",
+}
+
+_STATUS_COLOR = {
+    "pending": "yellow",
+    "running": "cyan",
+    "completed": "green",
+    "failed": "red",
+    "cancelled": "dim",
+}
+
+# (label, Settings attribute) pairs reported by `bughive doctor`
+_DOCTOR_SERVICE_CHECKS = (
+    ("Database", "DATABASE_URL"),
+    ("Redis", "REDIS_URL"),
+    ("Browserbase", "BROWSERBASE_API_KEY"),
+)
 
 
 @click.group()
 @click.version_option(version="0.1.0", prog_name="BugHive")
-def cli():
+@click.pass_context
+def cli(ctx: click.Context):
     """
     🐝 BugHive - Autonomous QA Agent System
 
     Automated web crawling, testing, and bug detection powered by AI.
     """
-    pass
+    ctx.ensure_object(dict)
+    ctx.obj["console"] = console = Console()
+    # Terminal status can't change mid-process; check isatty once
+    ctx.obj["is_tty"] = console.is_terminal
+
+    # Commands that need settings report the load error themselves
+    try:
+        ctx.obj["settings"] = _get_settings()
+    except Exception:
+        ctx.obj["settings"] = None
 
 
 @cli.command()
@@ -38,7 +81,8 @@ def cli():
 @click.option("--linear-team", help="Linear team ID for ticket creation")
 @click.option("--async", "run_async", is_flag=True, help="Run in background via Celery")
 @click.option("--output", "-o", type=click.Choice(["json", "table", "markdown"]), default="table", help="Output format")
-def crawl(url: str, max_pages: int, max_depth: int, auth: str, username: Optional[str],
+@click.pass_context
+def crawl(ctx: click.Context, url: str, max_pages: int, max_depth: int, auth: str, username: Optional[str],
           password: Optional[str], linear_team: Optional[str], run_async: bool, output: str):
     """
     Start a new crawl session.
@@ -56,6 +100,7 @@ def crawl(url: str, max_pages: int, max_depth: int, auth: str, username: Optiona
         # Background crawl with Linear integration
         bughive crawl https://example.com --async --linear-team TEAM-123
     """
+    console = ctx.obj["console"]
 
     console.print(Panel.fit(
         f"[bold cyan]🐝 BugHive[/bold cyan]\n\n"
@@ -111,6 +156,14 @@ def crawl(url: str, max_pages: int, max_depth: int, auth: str, username: Optiona
     else:
         # Run synchronously with progress
         try:
+            from rich.progress import (
+                BarColumn,
+                Progress,
+                SpinnerColumn,
+                TextColumn,
+                TimeElapsedColumn,
+            )
+
             from src.graph.workflow import run_bughive
 
             console.print()
@@ -124,15 +177,15 @@ def crawl(url: str, max_pages: int, max_depth: int, auth: str, username: Optiona
                 crawl_task = progress.add_task("[cyan]Initializing crawl...", total=max_pages)
 
                 # Run the workflow
-                summary = asyncio.run(run_bughive(config))
+                summary = _run(run_bughive(config))
                 progress.update(crawl_task, completed=max_pages, description="[green]Crawl complete!")
 
             console.print()
-            _display_summary(summary, output_format=output)
+            _display_summary(console, summary, output_format=output)
 
         except Exception as e:
             console.print(f"\n[red]✗ Crawl failed:[/red] {str(e)}")
-            if console.is_terminal:
+            if ctx.obj["is_tty"]:
                 console.print_exception()
             raise click.Abort()
 
@@ -140,8 +193,9 @@ def crawl(url: str, max_pages: int, max_depth: int, auth: str, username: Optiona
 @cli.command()
 @click.argument("session_id")
 @click.option("--watch", "-w", is_flag=True, help="Watch status in real-time")
-@click.option("--interval", "-i", default=5, help="Refresh interval for watch mode (seconds)")
-def status(session_id: str, watch: bool, interval: int):
+@click.option("--interval", "-i", default=5, type=click.IntRange(min=1), help="Refresh interval for watch mode (seconds)")
+@click.pass_context
+def status(ctx: click.Context, session_id: str, watch: bool, interval: int):
     """
     Check status of a crawl session.
 
@@ -155,35 +209,40 @@ def status(session_id: str, watch: bool, interval: int):
         # Watch status in real-time
         bughive status abc12345 --watch
     """
+    console = ctx.obj["console"]
 
     from src.workers.session_manager import SessionManager
 
     manager = SessionManager()
+    table_title = f"Session {session_id[:12]}..."
 
-    def get_status_table():
-        state = manager.get_session_state(session_id)
-
+    def get_status_table(state):
         if not state:
             return Panel("[red]Session not found[/red]", border_style="red")
 
-        status_emoji = {
-            "pending": "⏳",
-            "running": "🔄",
-            "completed": "✓",
-            "failed": "✗",
-            "cancelled": "⊘"
-        }.get(state.get("status", "unknown"), "❓")
-
-        status_color = {
-            "pending": "yellow",
-            "running": "cyan",
-            "completed": "green",
-            "failed": "red",
-            "cancelled": "dim"
-        }.get(state.get("status", "unknown"), "white")
+        session_status = state.get("status", "unknown")
+        status_emoji = _STATUS_EMOJI.get(session_status, "❓")
+        status_color = _STATUS_COLOR.get(session_status, "white")
+
+        rows = [
+            ("Status", f"{status_emoji} [{status_color}]{session_status.upper()}[/{status_color}]"),
+            ("Base URL", state.get("base_url", "N/A")),
+            ("Pages Crawled", f"{state.get('pages_crawled', 0)} / {state.get('max_pages', '?')}"),
+            ("Bugs Found", str(state.get("bugs_found", 0))),
+            ("Current Depth", str(state.get("current_depth", 0))),
+        ]
+
+        if state.get("started_at"):
+            rows.append(("Started", _format_timestamp(state["started_at"])))
+
+        if state.get("completed_at"):
+            rows.append(("Completed", _format_timestamp(state["completed_at"])))
+
+        if state.get("total_cost"):
+            rows.append(("Total Cost", f"${state['total_cost']:.4f}"))
 
         table = Table(
-            title=f"Session {session_id[:12]}...",
+            title=table_title,
             box=box.ROUNDED,
             border_style=status_color,
             show_header=True,
@@ -192,34 +251,33 @@ def status(session_id: str, watch: bool, interval: int):
         table.add_column("Metric", style="cyan", width=20)
         table.add_column("Value", style="green")
 
-        table.add_row("Status", f"{status_emoji} [{status_color}]{state.get('status', 'unknown').upper()}[/{status_color}]")
-        table.add_row("Base URL", state.get("base_url", "N/A"))
-        table.add_row("Pages Crawled", f"{state.get('pages_crawled', 0)} / {state.get('max_pages', '?')}")
-        table.add_row("Bugs Found", str(state.get("bugs_found", 0)))
-        table.add_row("Current Depth", str(state.get("current_depth", 0)))
+        for row in rows:
+            table.add_row(*row)
 
-        if state.get("started_at"):
-            table.add_row("Started", _format_timestamp(state["started_at"]))
+        return table
 
-        if state.get("completed_at"):
-            table.add_row("Completed", _format_timestamp(state["completed_at"]))
+    state = manager.get_session_state(session_id)
 
-        if state.get("total_cost"):
-            table.add_row("Total Cost", f"${state['total_cost']:.4f}")
-
-        return table
+    async def watch_status(live, state):
+        while True:
+            await asyncio.sleep(interval)
+            latest = manager.get_session_state(session_id)
+            # Only rebuild the table when the session actually changed
+            if latest != state:
+                state = latest
+                live.update(get_status_table(state), refresh=True)
 
     if watch:
+        from rich.live import Live
+
         try:
-            with Live(get_status_table(), refresh_per_second=1/interval, console=console) as live:
-                while True:
-                    import time
-                    time.sleep(interval)
-                    live.update(get_status_table())
+            # The state only changes once per poll, so repaint at the poll rate
+            with Live(get_status_table(state), refresh_per_second=1 / interval, console=console) as live:
+                _run(watch_status(live, state))
         except KeyboardInterrupt:
             console.print("\n[yellow]Watch mode stopped[/yellow]")
     else:
-        console.print(get_status_table())
+        console.print(get_status_table(state))
 
 
 @cli.command()
@@ -227,7 +285,8 @@ def status(session_id: str, watch: bool, interval: int):
 @click.option("--priority", "-p", type=click.Choice(["critical", "high", "medium", "low"]), help="Filter by priority")
 @click.option("--limit", "-l", default=50, help="Maximum number of bugs to show")
 @click.option("--output", "-o", type=click.Choice(["table", "json", "markdown"]), default="table", help="Output format")
-def bugs(session_id: str, priority: Optional[str], limit: int, output: str):
+@click.pass_context
+def bugs(ctx: click.Context, session_id: str, priority: Optional[str], limit: int, output: str):
     """
     List bugs found in a session.
 
@@ -244,6 +303,7 @@ def bugs(session_id: str, priority: Optional[str], limit: int, output: str):
         # Export as JSON
         bughive bugs abc12345 --output json
     """
+    console = ctx.obj["console"]
 
     console.print(f"[cyan]Fetching bugs for session {session_id[:12]}...[/cyan]")
 
@@ -269,9 +329,11 @@ def bugs(session_id: str, priority: Optional[str], limit: int, output: str):
         console.print("[dim]Database integration pending[/dim]")
 
     elif output == "json":
-        console.print_json('{"bugs": [], "total": 0}')
+        _print_json(console, {"bugs": [], "total": 0})
 
     elif output == "markdown":
+        from rich.markdown import Markdown
+
         md = "# Bugs Report\n\nNo bugs found yet."
         console.print(Markdown(md))
 
@@ -280,7 +342,8 @@ def bugs(session_id: str, priority: Optional[str], limit: int, output: str):
 @click.argument("session_id")
 @click.option("--format", "-f", type=click.Choice(["html", "pdf", "markdown", "json"]), default="markdown", help="Report format")
 @click.option("--output", "-o", type=click.Path(), help="Output file path")
-def report(session_id: str, format: str, output: Optional[str]):
+@click.pass_context
+def report(ctx: click.Context, session_id: str, format: str, output: Optional[str]):
     """
     Generate a detailed report for a session.
 
@@ -294,6 +357,7 @@ def report(session_id: str, format: str, output: Optional[str]):
         # Generate HTML report to file
         bughive report abc12345 --format html --output report.html
     """
+    console = ctx.obj["console"]
 
     console.print(f"[cyan]Generating {format.upper()} report for session {session_id[:12]}...[/cyan]")
 
@@ -303,7 +367,8 @@ def report(session_id: str, format: str, output: Optional[str]):
 
 @cli.command()
 @click.option("--show-secrets", is_flag=True, help="Show full API keys (use with caution)")
-def config(show_secrets: bool):
+@click.pass_context
+def config(ctx: click.Context, show_secrets: bool):
     """
     Show current BugHive configuration.
 
@@ -317,11 +382,11 @@ def config(show_secrets: bool):
         # Show full config with secrets
         bughive config --show-secrets
     """
+    console = ctx.obj["console"]
 
     try:
-        from src.core.config import get_settings
-
-        settings = get_settings()
+        # Re-raises the load error if the group couldn't build settings
+        settings = ctx.obj["settings"] or _get_settings()
 
         table = Table(
             title="🐝 BugHive Configuration",
@@ -334,55 +399,60 @@ def config(show_secrets: bool):
         table.add_column("Value", style="green")
         table.add_column("Status", width=10)
 
-        # Environment
-        table.add_row("Environment", settings.environment, _status_icon(True))
-        table.add_row("Debug Mode", str(settings.debug), _status_icon(settings.debug))
-
-        # Database
-        db_configured = bool(settings.database_url)
-        table.add_row(
-            "Database URL",
-            settings.database_url if show_secrets else _mask_url(settings.database_url),
-            _status_icon(db_configured)
-        )
-
-        # Redis
-        redis_configured = bool(settings.redis_url)
-        table.add_row(
-            "Redis URL",
-            settings.redis_url if show_secrets else _mask_url(settings.redis_url),
-            _status_icon(redis_configured)
-        )
-
-        # API Keys
-        browserbase_configured = bool(getattr(settings, 'browserbase_api_key', None))
-        table.add_row(
-            "Browserbase API",
-            _mask_secret(settings.browserbase_api_key if hasattr(settings, 'browserbase_api_key') else None, show_secrets),
-            _status_icon(browserbase_configured)
-        )
-
-        anthropic_configured = bool(getattr(settings, 'anthropic_api_key', None))
-        table.add_row(
-            "Anthropic API",
-            _mask_secret(settings.anthropic_api_key if hasattr(settings, 'anthropic_api_key') else None, show_secrets),
-            _status_icon(anthropic_configured)
-        )
-
-        openrouter_configured = bool(getattr(settings, 'openrouter_api_key', None))
-        table.add_row(
-            "OpenRouter API",
-            _mask_secret(settings.openrouter_api_key if hasattr(settings, 'openrouter_api_key') else None, show_secrets),
-            _status_icon(openrouter_configured)
-        )
-
-        # Linear
-        linear_configured = bool(getattr(settings, 'linear_api_key', None))
-        table.add_row(
-            "Linear API",
-            _mask_secret(settings.linear_api_key if hasattr(settings, 'linear_api_key') else None, show_secrets),
-            _status_icon(linear_configured)
-        )
+        database_url = settings.DATABASE_URL
+        redis_url = settings.REDIS_URL
+        browserbase_key = getattr(settings, "BROWSERBASE_API_KEY", None)
+        anthropic_key = getattr(settings, "ANTHROPIC_API_KEY", None)
+        openrouter_key = getattr(settings, "OPENROUTER_API_KEY", None)
+        linear_key = getattr(settings, "LINEAR_API_KEY", None)
+
+        def secret(value: Optional[str], masked: Optional[str]) -> str:
+            return (value if show_secrets else masked) or "[dim]Not configured[/dim]"
+
+        browserbase_configured = bool(browserbase_key)
+        anthropic_configured = bool(anthropic_key)
+        openrouter_configured = bool(openrouter_key)
+
+        rows = [
+            # Environment
+            ("Environment", settings.ENVIRONMENT.value, _status_icon(True)),
+            ("Debug Mode", str(settings.DEBUG), _status_icon(settings.DEBUG)),
+            # Services
+            (
+                "Database URL",
+                str(database_url) if show_secrets else _mask_url(database_url),
+                _status_icon(bool(database_url)),
+            ),
+            (
+                "Redis URL",
+                str(redis_url) if show_secrets else _mask_url(redis_url),
+                _status_icon(bool(redis_url)),
+            ),
+            # API Keys
+            (
+                "Browserbase API",
+                secret(browserbase_key, settings.browserbase_api_key_masked),
+                _status_icon(browserbase_configured),
+            ),
+            (
+                "Anthropic API",
+                secret(anthropic_key, settings.anthropic_api_key_masked),
+                _status_icon(anthropic_configured),
+            ),
+            (
+                "OpenRouter API",
+                secret(openrouter_key, settings.openrouter_api_key_masked),
+                _status_icon(openrouter_configured),
+            ),
+            # Linear
+            (
+                "Linear API",
+                secret(linear_key, settings.linear_api_key_masked),
+                _status_icon(bool(linear_key)),
+            ),
+        ]
+        for row in rows:
+            table.add_row(*row)
 
         console.print(table)
 
@@ -406,7 +476,8 @@ def config(show_secrets: bool):
 
 @cli.command()
 @click.option("--limit", "-l", default=20, help="Number of sessions to show")
-def sessions(limit: int):
+@click.pass_context
+def sessions(ctx: click.Context, limit: int):
     """
     List recent crawl sessions.
 
@@ -420,6 +491,7 @@ def sessions(limit: int):
         # Show last 50 sessions
         bughive sessions --limit 50
     """
+    console = ctx.obj["console"]
 
     console.print("[cyan]Fetching recent sessions...[/cyan]")
 
@@ -428,18 +500,17 @@ def sessions(limit: int):
 
 
 @cli.command()
-def doctor():
+@click.pass_context
+def doctor(ctx: click.Context):
     """
     Run diagnostic checks on BugHive installation.
 
     Verifies that all dependencies and services are properly configured.
     """
+    console = ctx.obj["console"]
 
-    console.print(Panel.fit(
-        "[bold cyan]🐝 BugHive Doctor[/bold cyan]\n\n"
-        "[dim]Running diagnostic checks...[/dim]",
-        border_style="cyan"
-    ))
+    header, all_ok_panel, failed_panel = _doctor_panels()
+    console.print(header)
 
     checks = []
 
@@ -456,26 +527,14 @@ def doctor():
         playwright_ok = False
     checks.append(("Playwright", playwright_ok, "Installed" if playwright_ok else "Not found"))
 
-    try:
-        from src.core.config import get_settings
-        config_ok = True
-    except Exception:
-        config_ok = False
+    settings = ctx.obj["settings"]
+    config_ok = settings is not None
     checks.append(("Configuration", config_ok, "Valid" if config_ok else "Invalid"))
 
     # Check services
-    try:
-        from src.core.config import get_settings
-        settings = get_settings()
-        db_ok = bool(settings.database_url)
-        redis_ok = bool(settings.redis_url)
-        browserbase_ok = bool(getattr(settings, 'browserbase_api_key', None))
-    except Exception:
-        db_ok = redis_ok = browserbase_ok = False
-
-    checks.append(("Database", db_ok, "Configured" if db_ok else "Not configured"))
-    checks.append(("Redis", redis_ok, "Configured" if redis_ok else "Not configured"))
-    checks.append(("Browserbase", browserbase_ok, "Configured" if browserbase_ok else "Not configured"))
+    for label, attr in _DOCTOR_SERVICE_CHECKS:
+        ok = bool(getattr(settings, attr, None))
+        checks.append((label, ok, "Configured" if ok else "Not configured"))
 
     # Display results
     console.print()
@@ -494,43 +553,62 @@ def doctor():
     console.print(table)
     console.print()
 
-    if all_ok:
-        console.print(Panel(
-            "[bold green]All checks passed! BugHive is ready to use.[/bold green]",
-            border_style="green"
-        ))
-    else:
-        console.print(Panel(
-            "[bold yellow]Some checks failed. Please review the configuration.[/bold yellow]\n\n"
-            "Run [bold]bughive config[/bold] for more details.",
-            border_style="yellow"
-        ))
+    console.print(all_ok_panel if all_ok else failed_panel)
+
+
+@lru_cache(maxsize=1)
+def _doctor_panels() -> tuple[Panel, Panel, Panel]:
+    """Build the constant doctor header and result panels once."""
+    header = Panel.fit(
+        "[bold cyan]🐝 BugHive Doctor[/bold cyan]\n\n"
+        "[dim]Running diagnostic checks...[/dim]",
+        border_style="cyan"
+    )
+    all_ok = Panel(
+        "[bold green]All checks passed! BugHive is ready to use.[/bold green]",
+        border_style="green"
+    )
+    failed = Panel(
+        "[bold yellow]Some checks failed. Please review the configuration.[/bold yellow]\n\n"
+        "Run [bold]bughive config[/bold] for more details.",
+        border_style="yellow"
+    )
+    return header, all_ok, failed
 
 
-def _display_summary(summary: dict, output_format: str = "table"):
+def _display_summary(console: Console, summary: dict, output_format: str = "table"):
     """Display crawl summary in a nice format."""
 
     if output_format == "json":
-        console.print_json(data=summary)
+        _print_json(console, summary)
         return
 
-    if output_format == "markdown":
-        md = f"""
-# Crawl Summary
-
-## Results
-- **Pages Crawled**: {summary.get('pages_crawled', 0)}
-- **Bugs Found**: {summary.get('bugs_found', 0)}
-- **Tickets Created**: {summary.get('tickets_created', 0)}
-- **Total Cost**: ${summary.get('total_cost', 0):.4f}
-- **Duration**: {summary.get('duration', 0):.1f}s
-
-## Bugs by Priority
-"""
-        if summary.get("bugs_by_priority"):
-            for priority, count in summary["bugs_by_priority"].items():
-                md += f"- **{priority.capitalize()}**: {count}\n"
+    pages = summary.get("pages_crawled", 0)
+    bugs_found = summary.get("bugs_found", 0)
+    tickets = summary.get("tickets_created", 0)
+    cost = summary.get("total_cost", 0)
+    duration = summary.get("duration", 0)
+    by_priority = summary.get("bugs_by_priority")
 
+    if output_format == "markdown":
+        from rich.markdown import Markdown
+
+        parts = [
+            "# Crawl Summary",
+            "",
+            "## Results",
+            f"- **Pages Crawled**: {pages}",
+            f"- **Bugs Found**: {bugs_found}",
+            f"- **Tickets Created**: {tickets}",
+            f"- **Total Cost**: ${cost:.4f}",
+            f"- **Duration**: {duration:.1f}s",
+            "",
+            "## Bugs by Priority",
+        ]
+        if by_priority:
+            parts.extend(f"- **{priority.capitalize()}**: {count}" for priority, count in by_priority.items())
+
+        md = "\n".join(parts)
         console.print(Markdown(md))
         return
 
@@ -545,19 +623,19 @@ def _display_summary(summary: dict, output_format: str = "table"):
     table.add_column("Metric", style="cyan", width=20)
     table.add_column("Value", style="green")
 
-    table.add_row("Pages Crawled", str(summary.get("pages_crawled", 0)))
-    table.add_row("Bugs Found", str(summary.get("bugs_found", 0)))
-    table.add_row("Tickets Created", str(summary.get("tickets_created", 0)))
-    table.add_row("Total Cost", f"${summary.get('total_cost', 0):.4f}")
-    table.add_row("Duration", f"{summary.get('duration', 0):.1f}s")
+    table.add_row("Pages Crawled", str(pages))
+    table.add_row("Bugs Found", str(bugs_found))
+    table.add_row("Tickets Created", str(tickets))
+    table.add_row("Total Cost", f"${cost:.4f}")
+    table.add_row("Duration", f"{duration:.1f}s")
 
     console.print(table)
 
     # Show bugs by priority
-    if summary.get("bugs_by_priority"):
+    if by_priority:
         console.print()
         console.print("[bold]Bugs by Priority:[/bold]")
-        for priority, count in summary["bugs_by_priority"].items():
+        for priority, count in by_priority.items():
             color = {
                 "critical": "red",
                 "high": "yellow",
@@ -573,39 +651,35 @@ def _display_summary(summary: dict, output_format: str = "table"):
             console.print(f"  {emoji} [{color}]{priority.capitalize()}[/{color}]: {count}")
 
 
-def _mask_url(url: str) -> str:
-    """Mask sensitive parts of URLs."""
-    if not url:
-        return "[dim]Not configured[/dim]"
-
-    if "://" in url:
-        parts = url.split("://")
-        protocol = parts[0]
-        rest = parts[1]
-
-        if "@" in rest:
-            # Mask credentials
-            creds, host = rest.split("@", 1)
-            return f"{protocol}://***:***@{host}"
+def _print_json(console: Console, data) -> None:
+    """Pretty-print data as JSON, serialised with orjson."""
+    # markup=False keeps brackets inside the JSON from being read as Rich tags
+    console.print(orjson.dumps(data, option=orjson.OPT_INDENT_2).decode(), markup=False)
 
-        # Mask host details but keep protocol
-        return f"{protocol}://***"
 
-    return url
+def _run(coro):
+    """Run a coroutine to completion, on uvloop when it is installed."""
+    if _uvloop_run is not None:
+        return _uvloop_run(coro)
+    return asyncio.run(coro)
 
 
-def _mask_secret(secret: Optional[str], show: bool = False) -> str:
-    """Mask API keys and secrets."""
-    if not secret:
+def _mask_url(url: str) -> str:
+    """Mask sensitive parts of URLs."""
+    if not url:
         return "[dim]Not configured[/dim]"
 
-    if show:
-        return secret
+    match = _URL_MASK_RE.match(str(url))
+    if match is None:
+        return url
 
-    if len(secret) > 8:
-        return f"{secret[:4]}...{secret[-4:]}"
+    protocol, creds, _host = match.groups()
+    if creds:
+        # Mask credentials
+        return f"{protocol}://***:***@{_host}"
 
-    return "***"
+    # Mask host details but keep protocol
+    return f"{protocol}://***"
 
 
 def _status_icon(configured: bool) -> str:
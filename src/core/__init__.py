@@ -1,6 +1,6 @@
 """Core functionality for BugHive including configuration and logging."""
 
-from .config import Settings, get_settings
+from .config import Settings, get_settings, reset_settings
 from .logging import setup_logging
 
-__all__ = ["Settings", "get_settings", "setup_logging"]
+__all__ = ["Settings", "get_settings", "reset_settings", "setup_logging"]
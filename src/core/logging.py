@@ -6,39 +6,126 @@ Provides consistent, structured logging across the application with:
 - Request ID tracking for distributed tracing
 - Timestamp formatting
 - Log level filtering
+- Censoring of sensitive keys (LOG_SCRUB)
+
+Censoring walks every event dict, including nested containers. Deployments
+that never pass secrets to the logger can set LOG_SCRUB=false to drop that
+walk from the processor chain, at the cost of no safety net if one slips in.
 """
 
+import atexit
+import io
 import logging
+import os
+import queue
+import re
 import sys
-from typing import Any
+import threading
+import time
+from functools import cache
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, TextIO
 
+import orjson
 import structlog
 from structlog.types import EventDict, Processor
 
 from .config import Environment, get_settings
 
+# Keys whose values are censored; a key matches if it contains any of these
+SENSITIVE_KEYS = frozenset({
+    "password",
+    "api_key",
+    "token",
+    "secret",
+    "apikey",
+    "authorization",
+    "auth",
+    "bearer",
+})
+SENSITIVE_RE = re.compile("|".join(map(re.escape, sorted(SENSITIVE_KEYS))))
+
+# Log lines are batched into this buffer and flushed on a short timer
+LOG_BUFFER_SIZE = 64 * 1024
+LOG_FLUSH_INTERVAL = 0.1  # seconds
+
+_log_listener: QueueListener | None = None
+_log_queue_handler: QueueHandler | None = None
+
 
-def add_app_context(logger: Any, method_name: str, event_dict: EventDict) -> EventDict:
-    """Add application context to log entries.
+def make_app_context_processor(app_name: str, environment: Environment) -> Processor:
+    """Build a processor that adds application context to log entries.
+
+    The values are resolved once here, so each log call only assigns two
+    strings instead of looking up settings.
 
     Args:
-        logger: The logger instance
-        method_name: The name of the method being called
-        event_dict: The event dictionary to modify
+        app_name: Application name to add to every entry
+        environment: The application environment
 
     Returns:
-        Modified event dictionary with app context
+        Processor adding ``app`` and ``environment`` to the event dictionary
     """
-    settings = get_settings()
-    event_dict["app"] = settings.APP_NAME
-    event_dict["environment"] = settings.ENVIRONMENT.value
-    return event_dict
+    # Interned once so every event shares the same string objects
+    app_name = sys.intern(app_name)
+    environment_name = sys.intern(environment.value)
+
+    def add_app_context(logger: Any, method_name: str, event_dict: EventDict) -> EventDict:
+        """Add application context to log entries."""
+        event_dict["app"] = app_name
+        event_dict["environment"] = environment_name
+        return event_dict
+
+    return add_app_context
+
+
+def _writable(entry: list[Any]) -> Any:
+    """Get a container from the censor worklist that is safe to modify.
+
+    Containers passed in by the caller are copied on first write, along with
+    any of their parents that are still the caller's objects.
+    """
+    pending = []
+    current = entry
+    while not current[3]:
+        pending.append(current)
+        current = current[1]
+
+    for item in reversed(pending):
+        container, parent, key, _ = item
+        copy = dict(container) if isinstance(container, dict) else list(container)
+        parent[0][key] = copy
+        item[0] = copy
+        item[3] = True
+
+    return entry[0]
+
+
+def _scrub_json_string(text: str) -> str:
+    """Censor sensitive keys inside a serialized JSON payload.
+
+    Returns the original string untouched if it isn't valid JSON or contains
+    nothing to censor, so clean payloads are never re-serialized.
+    """
+    try:
+        data = orjson.loads(text)
+    except orjson.JSONDecodeError:
+        return text
+
+    # Wrap so a censored top-level container shows up as a replaced value
+    wrapper = {"payload": data}
+    censor_sensitive_data(None, "", wrapper)
+    if wrapper["payload"] is data:
+        return text
+    return orjson.dumps(wrapper["payload"]).decode()
 
 
 def censor_sensitive_data(logger: Any, method_name: str, event_dict: EventDict) -> EventDict:
     """Censor sensitive data from logs.
 
     Removes or masks sensitive information like API keys, passwords, tokens, etc.
+    The event dict is updated in place; nested values passed in by the caller
+    are copied only when they contain something to censor.
 
     Args:
         logger: The logger instance
@@ -48,74 +135,231 @@ def censor_sensitive_data(logger: Any, method_name: str, event_dict: EventDict)
     Returns:
         Modified event dictionary with censored data
     """
-    sensitive_keys = {
-        "password",
-        "api_key",
-        "token",
-        "secret",
-        "apikey",
-        "authorization",
-        "auth",
-        "bearer",
-    }
-
-    def _censor_dict(data: dict[str, Any]) -> dict[str, Any]:
-        """Recursively censor sensitive keys in dictionary."""
-        censored: dict[str, Any] = {}
-        for key, value in data.items():
-            key_lower = key.lower()
-            if any(sensitive in key_lower for sensitive in sensitive_keys):
-                censored[key] = "***CENSORED***"
-            elif isinstance(value, dict):
-                censored[key] = _censor_dict(value)
-            elif isinstance(value, list):
-                censored[key] = [
-                    _censor_dict(item) if isinstance(item, dict) else item for item in value
-                ]
-            else:
-                censored[key] = value
-        return censored
-
-    # Cast to dict to satisfy mypy since event_dict is MutableMapping
-    return _censor_dict(dict(event_dict))
-
-
-def get_log_processors(environment: Environment) -> list[Processor]:
+    # Iterative walk; each entry is [container, parent entry, key in parent, owned]
+    stack: list[list[Any]] = [[event_dict, None, None, True]]
+    while stack:
+        entry = stack.pop()
+        container = entry[0]
+        if isinstance(container, dict):
+            for key, value in container.items():
+                # Most structured keys are already lowercase; skip the copy
+                key_lower = key if key.islower() else key.lower()
+                if key_lower in SENSITIVE_KEYS or SENSITIVE_RE.search(key_lower):
+                    _writable(entry)[key] = "***CENSORED***"
+                elif isinstance(value, (dict, list)):
+                    stack.append([value, entry, key, False])
+                elif (
+                    isinstance(value, str)
+                    and key_lower.endswith("_json")
+                    and value.startswith(("{", "["))
+                ):
+                    scrubbed = _scrub_json_string(value)
+                    if scrubbed is not value:
+                        _writable(entry)[key] = scrubbed
+        else:
+            for index, item in enumerate(container):
+                if isinstance(item, dict):
+                    stack.append([item, entry, index, False])
+    return event_dict
+
+
+def make_timestamper() -> Processor:
+    """Build a processor that adds an ISO 8601 UTC ``timestamp``.
+
+    Produces the same format as ``TimeStamper(fmt="iso")`` but only formats
+    the date/time part once per second; events within the same second just
+    append their microseconds.
+
+    Returns:
+        Processor adding ``timestamp`` to the event dictionary
+    """
+    # (second, formatted second) kept as one tuple so threads never see a torn pair
+    cached = (-1, "")
+
+    def add_timestamp(logger: Any, method_name: str, event_dict: EventDict) -> EventDict:
+        """Add the current UTC time to log entries."""
+        nonlocal cached
+        now = time.time()
+        second = int(now)
+        last_second, formatted = cached
+        if second != last_second:
+            formatted = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(second))
+            cached = (second, formatted)
+        event_dict["timestamp"] = f"{formatted}.{int((now - second) * 1_000_000):06d}Z"
+        return event_dict
+
+    return add_timestamp
+
+
+def _orjson_dumps(event_dict: EventDict, default: Any = None, **kwargs: Any) -> str:
+    """Serialize a log event with orjson for JSONRenderer.
+
+    Rendered events are handed to stdlib logging, which expects ``str``.
+    """
+    return orjson.dumps(event_dict, default=default, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
+def get_log_processors(
+    environment: Environment,
+    app_name: str | None = None,
+    scrub: bool = True,
+) -> tuple[Processor, ...]:
     """Get log processors based on environment.
 
+    The chain is built once per (environment, app_name, scrub) combination,
+    so repeated ``setup_logging()`` calls reuse the same processor instances.
+
     Args:
         environment: The application environment
+        app_name: Application name for log context (defaults to settings.APP_NAME)
+        scrub: Include the sensitive-data censoring processor
 
     Returns:
-        List of structlog processors
+        Tuple of structlog processors
     """
+    if app_name is None:
+        app_name = get_settings().APP_NAME
+    return _build_log_processors(environment, app_name, scrub)
+
+
+@cache
+def _build_log_processors(
+    environment: Environment,
+    app_name: str,
+    scrub: bool,
+) -> tuple[Processor, ...]:
+    """Build the processor chain for one logging configuration."""
     # Common processors for all environments
     common_processors: list[Processor] = [
         structlog.contextvars.merge_contextvars,
         structlog.stdlib.add_logger_name,
         structlog.stdlib.add_log_level,
-        structlog.stdlib.PositionalArgumentsFormatter(),
-        structlog.processors.TimeStamper(fmt="iso"),
+        # No PositionalArgumentsFormatter: the codebase logs key-value pairs
+        # only, and the filtering bound logger already applies any %-args
+        make_timestamper(),
         structlog.processors.StackInfoRenderer(),
-        add_app_context,
-        censor_sensitive_data,
+        make_app_context_processor(app_name, environment),
     ]
+    if scrub:
+        common_processors.append(censor_sensitive_data)
 
     # Environment-specific processors
     if environment == Environment.PRODUCTION:
         # Production: JSON output for log aggregation systems
-        return [
+        return (
             *common_processors,
             structlog.processors.format_exc_info,
-            structlog.processors.JSONRenderer(),
-        ]
+            structlog.processors.JSONRenderer(serializer=_orjson_dumps),
+        )
     else:
         # Development/Staging: Pretty console output
-        return [
+        return (
             *common_processors,
             structlog.processors.format_exc_info,
             structlog.dev.ConsoleRenderer(colors=True),
-        ]
+        )
+
+
+class _BufferedStreamHandler(logging.StreamHandler):
+    """StreamHandler whose output is flushed on a timer, not per record.
+
+    StreamHandler.emit() flushes after every record, which would empty the
+    write buffer after each line. Here that per-record flush is a no-op;
+    flush_buffer() does the real flush under the handler lock, so it never
+    interleaves with a write from the listener thread.
+    """
+
+    def flush(self) -> None:
+        """Skip the per-record flush; see flush_buffer()."""
+
+    def flush_buffer(self) -> None:
+        """Write out everything buffered so far."""
+        self.acquire()
+        try:
+            if self.stream and not self.stream.closed:
+                self.stream.flush()
+        finally:
+            self.release()
+
+
+def _open_buffered_stream(raw: io.RawIOBase, encoding: str = "utf-8") -> TextIO:
+    """Wrap a raw binary stream in a LOG_BUFFER_SIZE text buffer."""
+    return io.TextIOWrapper(
+        io.BufferedWriter(raw, buffer_size=LOG_BUFFER_SIZE),
+        encoding=encoding,
+        errors="backslashreplace",
+    )
+
+
+def _flush_periodically(handler: _BufferedStreamHandler, interval: float) -> None:
+    """Flush the handler every ``interval`` seconds (runs in a daemon thread)."""
+    while True:
+        time.sleep(interval)
+        try:
+            handler.flush_buffer()
+        except ValueError:
+            # Stream closed during interpreter shutdown
+            return
+
+
+def _make_stdout_handler() -> logging.StreamHandler:
+    """Get the handler that writes log output to stdout.
+
+    Records are collected in a 64KB buffer instead of costing one write()
+    syscall per line. A daemon thread flushes it every 100ms to bound
+    latency, and it is flushed again at exit so the tail isn't lost.
+
+    Falls back to a plain handler on ``sys.stdout`` when stdout has no file
+    descriptor (e.g. captured by a test runner).
+
+    Returns:
+        Handler for the log listener thread
+    """
+    try:
+        fd = sys.stdout.fileno()
+    except (AttributeError, ValueError, io.UnsupportedOperation):
+        return logging.StreamHandler(sys.stdout)
+
+    sys.stdout.flush()
+    # Write through a duplicate descriptor so closing this stream never closes stdout
+    stream = _open_buffered_stream(io.FileIO(os.dup(fd), "w"), sys.stdout.encoding or "utf-8")
+    handler = _BufferedStreamHandler(stream)
+    atexit.register(handler.flush_buffer)
+    threading.Thread(
+        target=_flush_periodically,
+        args=(handler, LOG_FLUSH_INTERVAL),
+        name="log-flush",
+        daemon=True,
+    ).start()
+    return handler
+
+
+def _start_log_listener() -> QueueHandler:
+    """Move log output onto a background thread.
+
+    Records are rendered by the structlog chain on the calling thread, then
+    handed to a queue; a QueueListener thread does the actual stdout write,
+    so a slow or blocked stdout never stalls the event loop. The listener is
+    started once per process; later calls return the same queue handler.
+
+    Returns:
+        Handler to attach to the root logger
+    """
+    global _log_listener, _log_queue_handler
+    if _log_listener is not None and _log_queue_handler is not None:
+        return _log_queue_handler
+
+    log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    _log_listener = QueueListener(
+        log_queue,
+        _make_stdout_handler(),
+        respect_handler_level=True,
+    )
+    _log_listener.start()
+    # Registered after the handler's flush, so it runs first and drains the queue
+    atexit.register(_log_listener.stop)
+    _log_queue_handler = QueueHandler(log_queue)
+    return _log_queue_handler
 
 
 def setup_logging() -> None:
@@ -128,16 +372,22 @@ def setup_logging() -> None:
 
     # Configure standard library logging
     log_level = getattr(logging, settings.LOG_LEVEL.upper(), logging.INFO)
-    logging.basicConfig(
-        format="%(message)s",
-        stream=sys.stdout,
-        level=log_level,
-    )
-
-    # Configure structlog
+    root_logger = logging.getLogger()
+    if root_logger.handlers:
+        # Already configured (basicConfig would be a no-op); just apply the level
+        root_logger.setLevel(log_level)
+    else:
+        logging.basicConfig(
+            format="%(message)s",
+            handlers=[_start_log_listener()],
+            level=log_level,
+        )
+
+    # Configure structlog; calls below log_level return immediately instead
+    # of running the processor chain only for stdlib to drop the record
     structlog.configure(
-        processors=get_log_processors(settings.ENVIRONMENT),
-        wrapper_class=structlog.stdlib.BoundLogger,
+        processors=get_log_processors(settings.ENVIRONMENT, settings.APP_NAME, settings.LOG_SCRUB),
+        wrapper_class=structlog.make_filtering_bound_logger(log_level),
         context_class=dict,
         logger_factory=structlog.stdlib.LoggerFactory(),
         cache_logger_on_first_use=True,
@@ -178,11 +428,12 @@ class LogContext:
             **kwargs: Key-value pairs to add to log context
         """
         self.context = kwargs
+        self._tokens: dict[str, Any] = {}
 
     def __enter__(self) -> None:
         """Enter the context and bind variables."""
-        structlog.contextvars.bind_contextvars(**self.context)
+        self._tokens = structlog.contextvars.bind_contextvars(**self.context)
 
     def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
-        """Exit the context and clear variables."""
-        structlog.contextvars.clear_contextvars()
+        """Exit the context and restore the variables bound before it."""
+        structlog.contextvars.reset_contextvars(**self._tokens)
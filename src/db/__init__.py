@@ -5,6 +5,7 @@ from .database import (
     DatabaseConfig,
     check_database_health,
     close_database,
+    disable_jit,
     get_database,
     get_db,
     init_database,
@@ -26,6 +27,7 @@ __all__ = [
     "init_database",
     "close_database",
     "check_database_health",
+    "disable_jit",
     # ORM Models
     "Base",
     "CrawlSessionDB",
@@ -244,6 +244,7 @@ class PageDB(Base):
         Index("idx_page_session_depth", "session_id", "depth"),
         Index("idx_page_url_session", "url", "session_id", unique=True),
         Index("idx_page_crawled_at", "crawled_at"),
+        Index("idx_page_session_created", "session_id", "created_at"),
     )
 
     def __repr__(self) -> str:
@@ -406,7 +407,7 @@ class BugDB(Base):
         Index("idx_bug_session_status", "session_id", "status"),
         Index("idx_bug_page_priority", "page_id", "priority"),
         Index("idx_bug_confidence", "confidence"),
-        Index("idx_bug_created_at", "created_at"),
+        Index("idx_bug_session_created", "session_id", "created_at"),
         Index("idx_bug_linear_issue", "linear_issue_id"),
     )
 
@@ -1,5 +1,6 @@
 """Tests for BrowserbaseClient."""
 
+import orjson
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -41,7 +42,7 @@ class TestBrowserbaseClient:
             mock_client.__aexit__.return_value = None
 
             mock_resp = MagicMock()
-            mock_resp.json.return_value = mock_response
+            mock_resp.content = orjson.dumps(mock_response)
             mock_resp.status_code = 200
             mock_client.post.return_value = mock_resp
 
@@ -52,6 +53,13 @@ class TestBrowserbaseClient:
             assert result == mock_response
             assert result["id"] == "session-123"
 
+            _, kwargs = mock_client.post.call_args
+            assert orjson.loads(kwargs["content"]) == {
+                "timeout": 300,
+                "projectId": "test-project-id",
+            }
+            assert kwargs["headers"]["x-bb-api-key"] == "test-api-key"
+
     @pytest.mark.asyncio
     async def test_create_session_via_api_failure(self, client):
         """Test session creation API failure."""
@@ -134,43 +142,40 @@ class TestBrowserbaseClient:
         """Test WebSocket URL construction."""
         client.session_id = "test-session-id"
 
-        expected_url = (
-            f"{BrowserbaseClient.WS_BASE_URL}"
-            f"?apiKey={client.api_key}"
-            f"&sessionId={client.session_id}"
-            "&enableProxy=true"
-        )
-
-        # Build URL same way client does
-        ws_endpoint = (
-            f"{client.WS_BASE_URL}"
-            f"?apiKey={client.api_key}"
-            f"&sessionId={client.session_id}"
-            "&enableProxy=true"
-        )
+        ws_endpoint = f"{client._ws_base_qs}&sessionId={client.session_id}"
 
-        assert ws_endpoint == expected_url
-        assert "wss://connect.browserbase.com" in ws_endpoint
-        assert "test-api-key" in ws_endpoint
-        assert "test-session-id" in ws_endpoint
+        assert ws_endpoint.startswith("wss://connect.browserbase.com?")
+        assert "apiKey=test-api-key" in ws_endpoint
+        assert "sessionId=test-session-id" in ws_endpoint
         assert "enableProxy=true" in ws_endpoint
 
+    def test_websocket_url_escapes_api_key(self):
+        """Test API keys with URL-special characters are encoded."""
+        client = BrowserbaseClient(api_key="key&with=special/chars", enable_proxy=False)
+
+        assert "apiKey=key%26with%3Dspecial%2Fchars" in client._ws_base_qs
+        assert "enableProxy=false" in client._ws_base_qs
+
     @pytest.mark.asyncio
     async def test_navigation_increments_counter(self, client):
         """Test that navigation increments page counter."""
         # Setup mocks
         client.page = MagicMock()
         client.page.goto = AsyncMock(return_value=MagicMock(status=200))
-        client.page.title = AsyncMock(return_value="Test Page")
-        client.page.url = "https://example.com"
+        client.page.evaluate = AsyncMock(
+            return_value={"url": "https://example.com/", "title": "Test Page"}
+        )
 
         initial_count = client._pages_count
 
         # Navigate
-        await client.navigate("https://example.com")
+        result = await client.navigate("https://example.com")
 
         # Verify counter incremented
         assert client._pages_count == initial_count + 1
+        assert result["url"] == "https://example.com/"
+        assert result["title"] == "Test Page"
+        client.page.evaluate.assert_awaited_once()
 
     @pytest.mark.asyncio
     async def test_screenshot_no_page_error(self, client):
@@ -1,8 +1,13 @@
 """Tests for PageExtractor."""
 
+import logging
+
+import orjson
 import pytest
+import structlog
 from unittest.mock import AsyncMock, MagicMock
 
+from src.browser import extractor as extractor_module
 from src.browser.extractor import PageExtractor
 
 
@@ -16,7 +21,9 @@ class TestPageExtractor:
         page.url = "https://example.com"
         page.title = AsyncMock(return_value="Example Page")
         page.evaluate = AsyncMock()
+        page.add_init_script = AsyncMock()
         page.on = MagicMock()
+        page.remove_listener = MagicMock()
         return page
 
     @pytest.fixture
@@ -28,9 +35,41 @@ class TestPageExtractor:
         """Test extractor initialization."""
         assert extractor.page == mock_page
         assert extractor.base_url == "https://example.com"
-        assert extractor._console_logs == []
-        assert extractor._network_responses == []
-        assert extractor._network_errors == []
+        assert len(extractor._console_logs) == 0
+        assert len(extractor._network_responses) == 0
+        assert len(extractor._network_errors) == 0
+
+    def test_event_buffers_are_bounded(self, mock_page):
+        """Test buffers keep only the most recent events."""
+        extractor = PageExtractor(mock_page, max_events=2)
+
+        for i in range(3):
+            msg = MagicMock()
+            msg.type = "log"
+            msg.text = f"message {i}"
+            extractor._handle_console(msg)
+
+        assert [log["text"] for log in extractor._console_logs] == ["message 1", "message 2"]
+
+    def test_origin_cached_from_base_url(self, mock_page):
+        """Test the link origin is parsed once from base_url."""
+        extractor = PageExtractor(mock_page, base_url="https://example.com:8443/app/")
+
+        assert extractor._origin == "https://example.com:8443"
+        assert extractor._link_origin() == "https://example.com:8443"
+
+    def test_origin_matches_anchor_origin_format(self, mock_page):
+        """Test credentials and default ports are dropped like a.origin does."""
+        extractor = PageExtractor(mock_page, base_url="https://user:pw@Example.com:443/x")
+
+        assert extractor._link_origin() == "https://example.com"
+
+    def test_origin_falls_back_to_page_url(self, mock_page):
+        """Test the link origin is resolved from the page when no base_url."""
+        extractor = PageExtractor(mock_page)
+
+        assert extractor._origin is None
+        assert extractor._link_origin() == "https://example.com"
 
     async def test_setup_listeners(self, extractor, mock_page):
         """Test listener setup."""
@@ -43,6 +82,30 @@ class TestPageExtractor:
         assert "response" in calls
         assert "requestfailed" in calls
 
+        # Performance observers installed browser-side
+        mock_page.add_init_script.assert_awaited_once()
+        assert "__bughive_metrics" in mock_page.add_init_script.call_args.kwargs["script"]
+
+    async def test_setup_listeners_idempotent(self, extractor, mock_page):
+        """Test repeated setup does not register handlers twice."""
+        await extractor.setup_listeners()
+        await extractor.setup_listeners()
+
+        assert mock_page.on.call_count == 3
+        mock_page.add_init_script.assert_awaited_once()
+
+    async def test_teardown_removes_listeners(self, extractor, mock_page):
+        """Test teardown detaches handlers and allows re-registration."""
+        await extractor.setup_listeners()
+        extractor.teardown()
+
+        removed = [call[0][0] for call in mock_page.remove_listener.call_args_list]
+        assert sorted(removed) == ["console", "requestfailed", "response"]
+
+        await extractor.setup_listeners()
+        assert mock_page.on.call_count == 6
+        mock_page.add_init_script.assert_awaited_once()
+
     def test_handle_console_error(self, extractor):
         """Test console error handling."""
         # Create mock console message
@@ -59,6 +122,7 @@ class TestPageExtractor:
         log = extractor._console_logs[0]
         assert log["level"] == "error"
         assert log["text"] == "TypeError: Cannot read property 'foo'"
+        assert isinstance(log["timestamp"], float)
 
     def test_handle_console_warning(self, extractor):
         """Test console warning handling."""
@@ -91,6 +155,21 @@ class TestPageExtractor:
         assert resp["url"] == "https://api.example.com/data"
         assert resp["status"] == 200
         assert resp["method"] == "GET"
+        assert resp["headers"] == {"content-type": "application/json"}
+
+    def test_handle_response_skips_uninteresting_headers(self, extractor):
+        """Test headers are not stored for successful static assets."""
+        response = MagicMock()
+        response.url = "https://cdn.example.com/logo.png"
+        response.status = 200
+        response.request.method = "GET"
+        response.request.resource_type = "image"
+        response.request.timing = {}
+        response.headers = {"content-type": "image/png"}
+
+        extractor._handle_response(response)
+
+        assert extractor._network_responses[0]["headers"] is None
 
     def test_handle_response_error(self, extractor):
         """Test error response handling."""
@@ -147,25 +226,25 @@ class TestPageExtractor:
         assert forms[0]["id"] == "login-form"
         assert forms[0]["method"] == "post"
         assert len(forms[0]["inputs"]) == 2
+        assert mock_page.evaluate.call_args[0][1] == 50
 
     @pytest.mark.asyncio
     async def test_extract_links(self, extractor, mock_page):
         """Test link extraction."""
-        # Mock links
-        all_links = [
+        # Mock links (filtered and deduplicated browser-side)
+        internal_links = [
             "https://example.com/about",
             "https://example.com/contact",
-            "https://other-site.com/external",
         ]
 
-        mock_page.evaluate.return_value = all_links
+        mock_page.evaluate.return_value = internal_links
 
         # Extract internal links only
         links = await extractor.extract_links(internal_only=True)
 
-        # Should filter to only internal links
-        assert len(links) == 2
-        assert all(link.startswith("https://example.com") for link in links)
+        # Origin is handed to the browser for filtering
+        assert links == internal_links
+        assert mock_page.evaluate.call_args[0][1] == "https://example.com"
 
     @pytest.mark.asyncio
     async def test_extract_links_all(self, extractor, mock_page):
@@ -181,6 +260,7 @@ class TestPageExtractor:
         links = await extractor.extract_links(internal_only=False)
 
         assert len(links) == 2
+        assert mock_page.evaluate.call_args[0][1] is None
 
     @pytest.mark.asyncio
     async def test_extract_performance_metrics(self, extractor, mock_page):
@@ -189,7 +269,7 @@ class TestPageExtractor:
             "loadTime": 1234,
             "domReady": 890,
             "firstPaint": 456,
-            "largestPaint": 678,
+            "firstContentfulPaint": 678,
         }
 
         mock_page.evaluate.return_value = metrics
@@ -220,14 +300,14 @@ class TestPageExtractor:
     @pytest.mark.asyncio
     async def test_extract_all(self, extractor, mock_page):
         """Test comprehensive data extraction."""
-        # Setup mock data
-        mock_page.evaluate.side_effect = [
-            [],  # forms
-            [],  # links
-            {"loadTime": 1000},  # performance
-            {"description": "Test"},  # meta tags
-        ]
-        mock_page.title.return_value = "Test Page"
+        # Setup mock data (single fused evaluate)
+        mock_page.evaluate.return_value = {
+            "forms": [],
+            "links": ["https://example.com/about"],
+            "performance": {"loadTime": 1000},
+            "metaTags": {"description": "Test"},
+            "title": "Test Page",
+        }
 
         # Add some console logs
         msg = MagicMock()
@@ -250,17 +330,176 @@ class TestPageExtractor:
 
         # Verify data
         assert data["title"] == "Test Page"
+        assert data["links"] == ["https://example.com/about"]
+        assert data["meta_tags"] == {"description": "Test"}
         assert len(data["console_logs"]) == 1
+        mock_page.evaluate.assert_awaited_once()
+        assert mock_page.evaluate.call_args[0][1] == {
+            "origin": "https://example.com",
+            "maxOptions": 50,
+        }
+
+    @pytest.mark.asyncio
+    async def test_extract_all_buffer_views(self, extractor, mock_page):
+        """Test extract_all returns list copies unless live buffers are requested."""
+        mock_page.evaluate.return_value = {
+            "forms": [],
+            "links": [],
+            "performance": {},
+            "metaTags": {},
+            "title": "Test Page",
+        }
+        extractor._handle_console(self._console_msg("error", "Test error"))
+
+        copied = await extractor.extract_all()
+        view = await extractor.extract_all(live_buffers=True)
+
+        assert isinstance(copied["console_logs"], list)
+        assert view["console_logs"] is extractor._console_logs
+        assert copied["console_logs"] == list(view["console_logs"])
+
+        # Later events don't leak into an already returned result
+        extractor._handle_console(self._console_msg("error", "Later error"))
+        extractor._flush_pending()
+        assert len(copied["console_logs"]) == 1
+
+    @pytest.mark.asyncio
+    async def test_extract_all_json(self, extractor, mock_page):
+        """Test JSON serialization of extracted page data."""
+        mock_page.evaluate.return_value = {
+            "forms": [],
+            "links": ["https://example.com/about"],
+            "performance": {"loadTime": 1000},
+            "metaTags": {},
+            "title": "Test Page",
+        }
+        extractor._handle_console(self._console_msg("error", "Test error"))
+
+        payload = orjson.loads(await extractor.extract_all_json())
+
+        assert payload["title"] == "Test Page"
+        assert payload["links"] == ["https://example.com/about"]
+        assert payload["console_logs"][0]["text"] == "Test error"
+
+    @pytest.mark.asyncio
+    async def test_extract_all_falls_back_to_individual_extractors(self, extractor, mock_page):
+        """Test per-category extraction when the fused script fails."""
+        mock_page.evaluate.side_effect = [
+            Exception("fused script error"),
+            [{"id": "search"}],  # forms
+            ["https://example.com/a"],  # links
+            {"loadTime": 1000},  # performance
+            {"description": "Test"},  # meta tags
+        ]
+        mock_page.title.return_value = "Fallback Page"
+
+        data = await extractor.extract_all()
+
+        assert data["title"] == "Fallback Page"
+        assert data["forms"] == [{"id": "search"}]
+        assert data["links"] == ["https://example.com/a"]
+        assert data["performance_metrics"] == {"loadTime": 1000}
+        assert data["meta_tags"] == {"description": "Test"}
+
+    @staticmethod
+    def _console_msg(level, text):
+        msg = MagicMock()
+        msg.type = level
+        msg.text = text
+        return msg
+
+    @staticmethod
+    def _response(url, status):
+        response = MagicMock()
+        response.url = url
+        response.status = status
+        response.request.method = "GET"
+        response.request.resource_type = "fetch"
+        response.request.timing = {}
+        return response
+
+    @pytest.mark.asyncio
+    async def test_events_batched_until_flush(self, extractor):
+        """Test events captured inside the loop are buffered until flushed."""
+        extractor._handle_console(self._console_msg("error", "Error 1"))
+        extractor._handle_console(self._console_msg("log", "Info 1"))
+
+        # Queued, with a single flush scheduled for the batch
+        assert len(extractor._console_logs) == 0
+        assert len(extractor._pending) == 2
+        assert extractor._flush_handle is not None
+
+        # Reads flush pending events first
+        assert [log["text"] for log in extractor.get_console_errors()] == ["Error 1"]
+        assert len(extractor._console_logs) == 2
+        assert extractor._flush_handle is None
+
+    @pytest.fixture
+    def structlog_level(self, monkeypatch):
+        """Set structlog's filtering level for the extractor's logger."""
+        saved = structlog.get_config()
+
+        def configure(level):
+            structlog.configure(
+                wrapper_class=structlog.make_filtering_bound_logger(level),
+                cache_logger_on_first_use=False,
+            )
+            monkeypatch.setattr(
+                extractor_module, "logger", structlog.get_logger(extractor_module.__name__)
+            )
+
+        yield configure
+        structlog.configure(**saved)
+
+    @pytest.mark.asyncio
+    async def test_flush_logs_event_details(self, extractor, structlog_level, caplog):
+        """Test the batched log record keeps url/status/text of failures."""
+        # Only structlog's level matters, not the (unconfigured) stdlib logger
+        structlog_level(logging.INFO)
+        caplog.set_level(logging.WARNING, logger="src.browser.extractor")
+        extractor._handle_console(self._console_msg("error", "Error 1"))
+        extractor._handle_console(self._console_msg("log", "Info 1"))
+        extractor._handle_response(self._response("http://test.com/missing", 404))
+        extractor._handle_response(self._response("http://test.com/ok", 200))
+
+        with structlog.testing.capture_logs() as logs:
+            extractor._flush_pending()
+
+        (record,) = [log for log in logs if log["event"] == "page_events_captured"]
+        assert record["console_errors"] == 1
+        assert record["failed_responses"] == 1
+        assert record["events"] == [
+            {"kind": "console", "level": "error", "text": "Error 1"},
+            {
+                "kind": "error_response",
+                "url": "http://test.com/missing",
+                "status": 404,
+                "method": "GET",
+            },
+        ]
+
+    @pytest.mark.asyncio
+    async def test_flush_skips_log_below_structlog_level(self, extractor, structlog_level):
+        """Test no batched record is emitted when structlog filters out INFO."""
+        structlog_level(logging.WARNING)
+        extractor._handle_console(self._console_msg("error", "Error 1"))
+
+        with structlog.testing.capture_logs() as logs:
+            extractor._flush_pending()
+
+        assert not [log for log in logs if log["event"] == "page_events_captured"]
+        assert len(extractor.get_console_errors()) == 1
 
     def test_get_console_errors(self, extractor):
         """Test getting console errors."""
         # Add different log levels
-        extractor._console_logs = [
-            {"level": "error", "text": "Error 1"},
-            {"level": "warning", "text": "Warning 1"},
-            {"level": "error", "text": "Error 2"},
-            {"level": "info", "text": "Info 1"},
-        ]
+        for level, text in [
+            ("error", "Error 1"),
+            ("warning", "Warning 1"),
+            ("error", "Error 2"),
+            ("info", "Info 1"),
+        ]:
+            extractor._handle_console(self._console_msg(level, text))
 
         errors = extractor.get_console_errors()
 
@@ -269,11 +508,12 @@ class TestPageExtractor:
 
     def test_get_console_warnings(self, extractor):
         """Test getting console warnings."""
-        extractor._console_logs = [
-            {"level": "error", "text": "Error 1"},
-            {"level": "warning", "text": "Warning 1"},
-            {"level": "warning", "text": "Warning 2"},
-        ]
+        for level, text in [
+            ("error", "Error 1"),
+            ("warning", "Warning 1"),
+            ("warning", "Warning 2"),
+        ]:
+            extractor._handle_console(self._console_msg(level, text))
 
         warnings = extractor.get_console_warnings()
 
@@ -282,11 +522,12 @@ class TestPageExtractor:
 
     def test_get_failed_requests(self, extractor):
         """Test getting failed requests."""
-        extractor._network_responses = [
-            {"url": "http://test.com/ok", "status": 200},
-            {"url": "http://test.com/not-found", "status": 404},
-            {"url": "http://test.com/error", "status": 500},
-        ]
+        for url, status in [
+            ("http://test.com/ok", 200),
+            ("http://test.com/not-found", 404),
+            ("http://test.com/error", 500),
+        ]:
+            extractor._handle_response(self._response(url, status))
 
         failed = extractor.get_failed_requests()
 
@@ -295,17 +536,26 @@ class TestPageExtractor:
 
     def test_get_slow_requests(self, extractor):
         """Test getting slow requests."""
-        extractor._network_responses = [
-            {"url": "http://test.com/fast", "timing": {"total": 500}},
-            {"url": "http://test.com/slow", "timing": {"total": 2000}},
-            {"url": "http://test.com/very-slow", "timing": {"total": 5000}},
-        ]
+        for url, total in [
+            ("http://test.com/fast", 500),
+            ("http://test.com/slow", 2000),
+            ("http://test.com/very-slow", 5000),
+        ]:
+            response = self._response(url, 200)
+            response.request.timing = {"responseEnd": total}
+            extractor._handle_response(response)
 
         slow = extractor.get_slow_requests(threshold_ms=1000)
 
         assert len(slow) == 2
         assert all(req["timing"]["total"] > 1000 for req in slow)
 
+        # Default threshold is served from the capture-time index
+        assert extractor.get_slow_requests() == slow
+
+        # Other thresholds fall back to scanning every response
+        assert len(extractor.get_slow_requests(threshold_ms=3000)) == 1
+
     def test_clear_data(self, extractor):
         """Test clearing captured data."""
         # Add some data
@@ -320,3 +570,13 @@ class TestPageExtractor:
         assert len(extractor._console_logs) == 0
         assert len(extractor._network_responses) == 0
         assert len(extractor._network_errors) == 0
+
+    def test_clear_data_resets_side_indices(self, extractor):
+        """Test clearing also drops the filtered error views."""
+        extractor._handle_console(self._console_msg("error", "Error 1"))
+        extractor._handle_response(self._response("http://test.com/error", 500))
+
+        extractor.clear_data()
+
+        assert extractor.get_console_errors() == []
+        assert extractor.get_failed_requests() == []
@@ -1,23 +1,46 @@
 """Tests for Navigator."""
 
+import asyncio
+import logging
+
 import pytest
+import structlog
 from unittest.mock import AsyncMock, MagicMock, patch
 
-from src.browser.navigator import Navigator, NavigationError
+from src.browser import navigator as navigator_module
+from src.browser.navigator import Navigator, NavigationError, PagePool
 
 
 class TestNavigator:
     """Test suite for Navigator."""
 
     @pytest.fixture
-    def mock_page(self):
+    def mock_locator(self):
+        """Create mock Playwright locator."""
+        locator = MagicMock()
+        locator.wait_for = AsyncMock()
+        locator.click = AsyncMock()
+        locator.press_sequentially = AsyncMock()
+        locator.fill = AsyncMock()
+        locator.press = AsyncMock()
+        locator.hover = AsyncMock()
+        locator.select_option = AsyncMock()
+        return locator
+
+    @pytest.fixture
+    def mock_page(self, mock_locator):
         """Create mock Playwright page."""
+        Navigator._locators.clear()
+        Navigator._blocking_pages.clear()
+        Navigator._watched_pages.clear()
+
         page = MagicMock()
         page.url = "https://example.com"
         page.goto = AsyncMock()
         page.wait_for_load_state = AsyncMock()
         page.evaluate = AsyncMock()
         page.wait_for_selector = AsyncMock()
+        page.locator = MagicMock(return_value=MagicMock(first=mock_locator))
         page.click = AsyncMock()
         page.type = AsyncMock()
         page.fill = AsyncMock()
@@ -26,14 +49,40 @@ class TestNavigator:
         page.add_style_tag = AsyncMock()
         page.query_selector_all = AsyncMock(return_value=[])
         page.expect_navigation = MagicMock()
+        page.route = AsyncMock()
         return page
 
+    def test_class_reexports_module_functions(self):
+        """Test Navigator delegates to the module-level helpers."""
+        from src.browser import navigator
+
+        assert Navigator.navigate_with_human_behavior is navigator.navigate_with_human_behavior
+        assert Navigator.dismiss_overlays is navigator.dismiss_overlays
+        assert Navigator._locators is navigator._locators
+
     def test_random_delay_range(self):
         """Test random delay is within expected range."""
         for _ in range(100):
             delay = Navigator._random_delay(1.0, 2.0)
             assert 1.0 <= delay <= 2.0
 
+    def test_random_delay_refills_pool(self):
+        """Test delay pool is refilled once exhausted."""
+        Navigator._delay_pool.clear()
+
+        delays = [Navigator._random_delay(0.5, 1.5) for _ in range(1500)]
+
+        assert all(0.5 <= d <= 1.5 for d in delays)
+        assert len(set(delays)) > 1000
+
+    def test_typing_chunks(self):
+        """Test typing chunks cover the value without gaps."""
+        for value in ["", "a", "ab", "test@example.com", "x" * 41]:
+            chunks = Navigator._typing_chunks(value)
+            assert "".join(chunks) == value
+            assert len(chunks) <= 5
+            assert all(chunks)
+
     @pytest.mark.asyncio
     async def test_navigate_with_human_behavior_success(self, mock_page):
         """Test successful navigation with human behavior."""
@@ -55,6 +104,79 @@ class TestNavigator:
         mock_page.wait_for_load_state.assert_awaited()
         mock_page.evaluate.assert_awaited()  # For scrolling
 
+    @pytest.mark.asyncio
+    async def test_navigate_waits_for_ready_selector(self, mock_page):
+        """Test navigation waits on load and the caller's ready selector."""
+        mock_response = MagicMock()
+        mock_response.status = 200
+        mock_page.goto.return_value = mock_response
+
+        result = await Navigator.navigate_with_human_behavior(
+            mock_page,
+            "https://example.com",
+            ready_selector="main",
+        )
+
+        assert result is True
+        mock_page.goto.assert_awaited_once_with(
+            "https://example.com", wait_until="commit", timeout=30000
+        )
+        assert [c.args[0] for c in mock_page.wait_for_load_state.await_args_list] == [
+            "domcontentloaded",
+            "load",
+        ]
+        mock_page.wait_for_selector.assert_awaited_once_with("main", timeout=5000)
+
+    @pytest.mark.asyncio
+    async def test_navigate_commit_skips_load_waits(self, mock_page):
+        """Test commit navigation returns without waiting on load states."""
+        mock_response = MagicMock()
+        mock_response.status = 200
+        mock_page.goto.return_value = mock_response
+
+        result = await Navigator.navigate_with_human_behavior(
+            mock_page,
+            "https://example.com",
+            wait_until="commit",
+        )
+
+        assert result is True
+        mock_page.wait_for_load_state.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_resource_blocker_aborts_heavy_resources(self, mock_page):
+        """Test blocked resource types are aborted and others continue."""
+        await Navigator.install_resource_blocker(mock_page)
+        await Navigator.install_resource_blocker(mock_page)
+
+        mock_page.route.assert_awaited_once()
+        pattern, handler = mock_page.route.await_args[0]
+        assert pattern == "**/*"
+
+        for resource_type, aborted in [("image", True), ("font", True), ("script", False)]:
+            route = MagicMock()
+            route.request.resource_type = resource_type
+            route.abort = AsyncMock()
+            route.continue_ = AsyncMock()
+
+            await handler(route)
+
+            assert route.abort.await_count == int(aborted)
+            assert route.continue_.await_count == int(not aborted)
+
+    @pytest.mark.asyncio
+    async def test_navigate_with_block_resources(self, mock_page):
+        """Test navigation installs the resource blocker on request."""
+        mock_page.goto.return_value = MagicMock(status=200)
+
+        await Navigator.navigate_with_human_behavior(
+            mock_page,
+            "https://example.com",
+            block_resources=True,
+        )
+
+        mock_page.route.assert_awaited_once()
+
     @pytest.mark.asyncio
     async def test_navigate_with_human_behavior_no_response(self, mock_page):
         """Test navigation with no response raises error."""
@@ -68,21 +190,57 @@ class TestNavigator:
 
         assert "No response received" in str(exc_info.value)
 
+    @pytest.mark.asyncio
+    async def test_process_urls(self):
+        """Test concurrent navigation across a pool of pages."""
+        pages = [MagicMock(), MagicMock()]
+        in_flight: dict[int, int] = {}
+        max_per_page = 0
+
+        async def fake_navigate(page, url, wait_until):
+            nonlocal max_per_page
+            in_flight[id(page)] = in_flight.get(id(page), 0) + 1
+            max_per_page = max(max_per_page, in_flight[id(page)])
+            await asyncio.sleep(0.01)
+            in_flight[id(page)] -= 1
+            if url.endswith("/bad"):
+                raise NavigationError("boom")
+            return True
+
+        urls = ["https://example.com/a", "https://example.com/bad", "https://example.com/c"]
+        with patch("src.browser.navigator.navigate_with_human_behavior", side_effect=fake_navigate):
+            results = await Navigator.process_urls(pages, urls, concurrency=5)
+
+        assert results == [
+            ("https://example.com/a", True),
+            ("https://example.com/bad", False),
+            ("https://example.com/c", True),
+        ]
+        # A page is never driven by two navigations at once
+        assert max_per_page == 1
+
+    @pytest.mark.asyncio
+    async def test_process_urls_requires_pages(self):
+        """Test processing URLs without pages raises error."""
+        with pytest.raises(ValueError):
+            await Navigator.process_urls([], ["https://example.com"])
+
     @pytest.mark.asyncio
     async def test_random_scroll(self, mock_page):
         """Test random scrolling."""
         await Navigator.random_scroll(mock_page, num_scrolls=3)
 
-        # Should have scrolled 3 times
-        assert mock_page.evaluate.await_count == 3
-
-        # Verify scroll commands
-        for call in mock_page.evaluate.await_args_list:
-            args = call[0]
-            assert "window.scrollBy" in args[0]
+        # Whole sequence runs in a single evaluate
+        mock_page.evaluate.assert_awaited_once()
+        script, steps = mock_page.evaluate.await_args[0]
+        assert "window.scrollBy" in script
+        assert len(steps) == 3
+        for amount, pause_ms in steps:
+            assert 100 <= amount <= 500
+            assert 500 <= pause_ms <= 1500
 
     @pytest.mark.asyncio
-    async def test_fill_form_with_char_delay(self, mock_page):
+    async def test_fill_form_with_char_delay(self, mock_page, mock_locator):
         """Test form filling with character delays."""
         value = "test@example.com"
 
@@ -95,13 +253,17 @@ class TestNavigator:
 
         # Verify
         assert result is True
-        mock_page.wait_for_selector.assert_awaited_once()
-        mock_page.click.assert_awaited_once()
-        # Should type each character
-        assert mock_page.type.await_count == len(value)
+        mock_locator.wait_for.assert_awaited_once()
+        mock_locator.click.assert_awaited_once()
+        # Should type in a handful of chunks rather than per character
+        assert 3 <= mock_locator.press_sequentially.await_count <= 5
+        typed = "".join(call[0][0] for call in mock_locator.press_sequentially.await_args_list)
+        assert typed == value
+        for call in mock_locator.press_sequentially.await_args_list:
+            assert 80 <= call[1]["delay"] <= 200
 
     @pytest.mark.asyncio
-    async def test_fill_form_without_delay(self, mock_page):
+    async def test_fill_form_without_delay(self, mock_page, mock_locator):
         """Test form filling without character delays."""
         result = await Navigator.fill_form(
             mock_page,
@@ -112,14 +274,33 @@ class TestNavigator:
 
         # Verify
         assert result is True
-        mock_page.fill.assert_awaited_once()
+        mock_locator.fill.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_fill_form_long_value_is_filled(self, mock_page, mock_locator):
+        """Test long values skip per-key typing."""
+        value = "https://example.com/some/long/path?with=query"
+
+        result = await Navigator.fill_form(mock_page, selector="#url", value=value)
+
+        assert result is True
+        mock_locator.fill.assert_awaited_once_with(value)
+        mock_locator.press_sequentially.assert_not_awaited()
+        mock_locator.press.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_fill_form_commit_presses_tab(self, mock_page, mock_locator):
+        """Test committing a field tabs out of it."""
+        await Navigator.fill_form(mock_page, selector="#email", value="a@b.co", commit=True)
+
+        mock_locator.press.assert_awaited_once_with("Tab")
 
     @pytest.mark.asyncio
-    async def test_fill_form_timeout(self, mock_page):
+    async def test_fill_form_timeout(self, mock_page, mock_locator):
         """Test form filling timeout."""
         from playwright.async_api import TimeoutError as PlaywrightTimeoutError
 
-        mock_page.wait_for_selector.side_effect = PlaywrightTimeoutError("Timeout")
+        mock_locator.wait_for.side_effect = PlaywrightTimeoutError("Timeout")
 
         with pytest.raises(NavigationError) as exc_info:
             await Navigator.fill_form(
@@ -131,7 +312,7 @@ class TestNavigator:
         assert "Form field not found" in str(exc_info.value)
 
     @pytest.mark.asyncio
-    async def test_click_element_success(self, mock_page):
+    async def test_click_element_success(self, mock_page, mock_locator):
         """Test clicking element successfully."""
         result = await Navigator.click_element(
             mock_page,
@@ -140,8 +321,30 @@ class TestNavigator:
         )
 
         assert result is True
-        mock_page.wait_for_selector.assert_awaited_once()
-        mock_page.click.assert_awaited_once()
+        mock_locator.wait_for.assert_awaited_once()
+        mock_locator.click.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_locator_memoized_per_page_and_selector(self, mock_page, mock_locator):
+        """Test repeated actions reuse one locator for the first match."""
+        await Navigator.click_element(mock_page, selector="button.submit")
+        await Navigator.hover_element(mock_page, selector="button.submit")
+
+        mock_page.locator.assert_called_once_with("button.submit")
+        assert Navigator.locator(mock_page, "button.submit") is mock_locator
+        mock_page.on.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_page_close_forgets_locators(self, mock_page):
+        """Test locators are dropped when their page closes."""
+        Navigator.locator(mock_page, "button.submit")
+        event, handler = mock_page.on.call_args[0]
+
+        assert event == "close"
+        handler(mock_page)
+
+        assert Navigator._locators == {}
+        assert Navigator._watched_pages == set()
 
     @pytest.mark.asyncio
     async def test_click_element_with_navigation(self, mock_page):
@@ -164,39 +367,109 @@ class TestNavigator:
     @pytest.mark.asyncio
     async def test_dismiss_overlays_basic(self, mock_page):
         """Test basic overlay dismissal."""
-        # Mock finding a cookie consent button
-        mock_element = MagicMock()
-        mock_element.is_visible = AsyncMock(return_value=True)
-        mock_element.click = AsyncMock()
-        mock_page.query_selector_all.return_value = [mock_element]
-        mock_page.evaluate.return_value = 0
+        # Mock the in-page pass clicking a cookie consent button
+        mock_page.evaluate.return_value = {"clicked": "accept", "removed": 0, "overlays": False}
 
         result = await Navigator.dismiss_overlays(
             mock_page,
             aggressive=False,
         )
 
-        # Should have tried to click buttons
-        mock_page.query_selector_all.assert_awaited()
+        # Clicking happens in a single evaluate, without element handles
+        assert result is True
+        mock_page.evaluate.assert_awaited_once()
+        mock_page.query_selector_all.assert_not_awaited()
+        mock_page.add_style_tag.assert_not_awaited()
+        assert mock_page.evaluate.await_args[0][1] is False
+
+    @pytest.mark.asyncio
+    async def test_dismiss_overlays_nothing_found(self, mock_page):
+        """Test overlay dismissal on a clean page."""
+        mock_page.evaluate.return_value = {"clicked": None, "removed": 0, "overlays": False}
+
+        with patch("src.browser.navigator.asyncio.sleep", new=AsyncMock()) as sleep:
+            result = await Navigator.dismiss_overlays(mock_page, aggressive=False)
+
+        assert result is False
+        sleep.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_dismiss_overlays_aggressive_clean_page(self, mock_page):
+        """Test aggressive dismissal skips CSS injection without overlays."""
+        mock_page.evaluate.return_value = {"clicked": None, "removed": 0, "overlays": False}
+
+        result = await Navigator.dismiss_overlays(mock_page, aggressive=True)
+
+        assert result is False
+        mock_page.add_style_tag.assert_not_awaited()
 
     @pytest.mark.asyncio
     async def test_dismiss_overlays_aggressive(self, mock_page):
         """Test aggressive overlay dismissal."""
         # Mock removing elements
-        mock_page.evaluate.return_value = 5  # 5 elements removed
+        mock_page.evaluate.return_value = {"clicked": None, "removed": 5, "overlays": True}
 
         result = await Navigator.dismiss_overlays(
             mock_page,
             aggressive=True,
         )
 
-        # Should have added CSS and removed elements
+        # Should have removed elements and added CSS
         mock_page.add_style_tag.assert_awaited_once()
-        mock_page.evaluate.assert_awaited()
+        mock_page.evaluate.assert_awaited_once()
         assert result is True
 
     @pytest.mark.asyncio
-    async def test_wait_for_element_success(self, mock_page):
+    async def test_batch_runs_steps_in_one_evaluate(self, mock_page):
+        """Test batched steps share a single evaluate round-trip."""
+        mock_page.evaluate.return_value = [
+            {"clicked": "accept", "removed": 0, "overlays": True},
+            None,
+        ]
+
+        async with Navigator.batch(mock_page) as b:
+            b.dismiss_overlays()
+            b.random_scroll(num_scrolls=2)
+
+        mock_page.evaluate.assert_awaited_once()
+        script, args = mock_page.evaluate.await_args[0]
+        assert "window.scrollBy" in script
+        assert args[0] is True
+        assert len(args[1]) == 2
+        mock_page.add_style_tag.assert_awaited_once()
+        assert b.results == {"dismiss_overlays": True, "random_scroll": None}
+
+    @pytest.mark.asyncio
+    async def test_batch_failure_raises_navigation_error(self, mock_page):
+        """Test a failing batched script raises NavigationError."""
+        mock_page.evaluate.side_effect = Exception("Execution context was destroyed")
+
+        with pytest.raises(NavigationError):
+            async with Navigator.batch(mock_page) as b:
+                b.random_scroll()
+
+    @pytest.mark.asyncio
+    async def test_batch_short_results_raise(self, mock_page):
+        """Test a script returning fewer results than steps is not ignored."""
+        mock_page.evaluate.return_value = [
+            {"clicked": "accept", "removed": 0, "overlays": True},
+        ]
+
+        with pytest.raises(ValueError):
+            async with Navigator.batch(mock_page) as b:
+                b.dismiss_overlays()
+                b.random_scroll()
+
+    def test_batch_rejects_duplicate_steps(self, mock_page):
+        """Test adding the same step twice raises error."""
+        b = Navigator.batch(mock_page)
+        b.random_scroll()
+
+        with pytest.raises(ValueError):
+            b.random_scroll()
+
+    @pytest.mark.asyncio
+    async def test_wait_for_element_success(self, mock_page, mock_locator):
         """Test waiting for element successfully."""
         result = await Navigator.wait_for_element(
             mock_page,
@@ -206,18 +479,15 @@ class TestNavigator:
         )
 
         assert result is True
-        mock_page.wait_for_selector.assert_awaited_once_with(
-            ".element",
-            state="visible",
-            timeout=5000,
-        )
+        mock_page.locator.assert_called_once_with(".element")
+        mock_locator.wait_for.assert_awaited_once_with(state="visible", timeout=5000)
 
     @pytest.mark.asyncio
-    async def test_wait_for_element_timeout(self, mock_page):
+    async def test_wait_for_element_timeout(self, mock_page, mock_locator):
         """Test waiting for element timeout."""
         from playwright.async_api import TimeoutError as PlaywrightTimeoutError
 
-        mock_page.wait_for_selector.side_effect = PlaywrightTimeoutError("Timeout")
+        mock_locator.wait_for.side_effect = PlaywrightTimeoutError("Timeout")
 
         with pytest.raises(NavigationError) as exc_info:
             await Navigator.wait_for_element(
@@ -229,16 +499,16 @@ class TestNavigator:
         assert "did not reach visible state" in str(exc_info.value)
 
     @pytest.mark.asyncio
-    async def test_hover_element(self, mock_page):
+    async def test_hover_element(self, mock_page, mock_locator):
         """Test hovering over element."""
         result = await Navigator.hover_element(mock_page, selector=".menu-item")
 
         assert result is True
-        mock_page.wait_for_selector.assert_awaited_once()
-        mock_page.hover.assert_awaited_once()
+        mock_locator.wait_for.assert_awaited_once()
+        mock_locator.hover.assert_awaited_once()
 
     @pytest.mark.asyncio
-    async def test_select_option_by_value(self, mock_page):
+    async def test_select_option_by_value(self, mock_page, mock_locator):
         """Test selecting option by value."""
         result = await Navigator.select_option(
             mock_page,
@@ -247,10 +517,10 @@ class TestNavigator:
         )
 
         assert result is True
-        mock_page.select_option.assert_awaited_once()
+        mock_locator.select_option.assert_awaited_once()
 
     @pytest.mark.asyncio
-    async def test_select_option_by_label(self, mock_page):
+    async def test_select_option_by_label(self, mock_page, mock_locator):
         """Test selecting option by label."""
         result = await Navigator.select_option(
             mock_page,
@@ -259,7 +529,7 @@ class TestNavigator:
         )
 
         assert result is True
-        mock_page.select_option.assert_awaited_once()
+        mock_locator.select_option.assert_awaited_once()
 
     @pytest.mark.asyncio
     async def test_select_option_no_value_or_label(self, mock_page):
@@ -285,15 +555,35 @@ class TestNavigator:
         assert elapsed < 0.3
 
     @pytest.mark.asyncio
-    async def test_navigate_handles_networkidle_timeout(self, mock_page):
-        """Test navigation handles networkidle timeout gracefully."""
+    async def test_human_delay_logs_at_structlog_debug(self, monkeypatch, caplog):
+        """Test the delay debug log follows structlog's level, not stdlib's."""
+        saved = structlog.get_config()
+        structlog.configure(
+            wrapper_class=structlog.make_filtering_bound_logger(logging.DEBUG),
+            cache_logger_on_first_use=False,
+        )
+        monkeypatch.setattr(
+            navigator_module, "logger", structlog.get_logger(navigator_module.__name__)
+        )
+        caplog.set_level(logging.WARNING, logger="src.browser.navigator")
+        try:
+            with structlog.testing.capture_logs() as logs:
+                await Navigator._human_delay(0.0, 0.0)
+        finally:
+            structlog.configure(**saved)
+
+        assert [log["event"] for log in logs] == ["human_delay"]
+
+    @pytest.mark.asyncio
+    async def test_navigate_handles_load_timeout(self, mock_page):
+        """Test navigation handles load timeout gracefully."""
         from playwright.async_api import TimeoutError as PlaywrightTimeoutError
 
-        # Mock goto success but networkidle timeout
+        # Mock goto success but load timeout
         mock_response = MagicMock()
         mock_response.status = 200
         mock_page.goto.return_value = mock_response
-        mock_page.wait_for_load_state.side_effect = PlaywrightTimeoutError("Networkidle timeout")
+        mock_page.wait_for_load_state.side_effect = PlaywrightTimeoutError("Load timeout")
 
         # Should still succeed
         result = await Navigator.navigate_with_human_behavior(
@@ -302,3 +592,85 @@ class TestNavigator:
         )
 
         assert result is True
+
+
+class TestPagePool:
+    """Test suite for PagePool."""
+
+    @staticmethod
+    def _page():
+        page = MagicMock()
+        page.goto = AsyncMock()
+        page.close = AsyncMock()
+        page.is_closed = MagicMock(return_value=False)
+        return page
+
+    @pytest.fixture
+    def mock_context(self):
+        """Create mock browser context that opens fresh pages."""
+        context = MagicMock()
+        context.opened = []
+
+        def new_page():
+            page = self._page()
+            context.opened.append(page)
+            return page
+
+        context.new_page = AsyncMock(side_effect=new_page)
+        return context
+
+    @pytest.mark.asyncio
+    async def test_acquire_reuses_warm_pages(self, mock_context):
+        """Test pages are opened once and reset between uses."""
+        async with PagePool(mock_context, size=2) as pool:
+            async with pool.acquire() as first:
+                pass
+            async with pool.acquire() as second:
+                pass
+
+        assert mock_context.new_page.await_count == 2
+        first.goto.assert_awaited_with("about:blank")
+        second.goto.assert_awaited_with("about:blank")
+
+    @pytest.mark.asyncio
+    async def test_acquire_waits_for_free_page(self, mock_context):
+        """Test acquisition blocks while every page is in use."""
+        pool = PagePool(mock_context, size=1)
+        await pool.init()
+
+        async with pool.acquire():
+            waiter = asyncio.ensure_future(pool.acquire().__aenter__())
+            await asyncio.sleep(0)
+            assert not waiter.done()
+
+        page = await asyncio.wait_for(waiter, timeout=1)
+        assert page is not None
+
+    @pytest.mark.asyncio
+    async def test_page_recycled_after_max_uses(self, mock_context):
+        """Test worn-out pages are closed and replaced."""
+        pool = PagePool(mock_context, size=1, max_uses=2)
+        await pool.init()
+
+        async with pool.acquire() as page:
+            pass
+        async with pool.acquire() as same_page:
+            pass
+        async with pool.acquire() as new_page:
+            pass
+
+        assert same_page is page
+        assert new_page is not page
+        page.close.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_close_closes_idle_pages(self, mock_context):
+        """Test closing the pool closes pooled pages."""
+        pool = PagePool(mock_context, size=2)
+        await pool.init()
+
+        await pool.close()
+
+        assert len(mock_context.opened) == 2
+        for page in mock_context.opened:
+            page.close.assert_awaited_once()
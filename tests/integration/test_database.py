@@ -0,0 +1,57 @@
+"""Integration tests for database session management.
+
+These need a PostgreSQL server; set TEST_DATABASE_URL to run them.
+"""
+
+import os
+
+import pytest
+
+TEST_DATABASE_URL = os.getenv("TEST_DATABASE_URL")
+if not TEST_DATABASE_URL:
+    pytest.skip("TEST_DATABASE_URL not set", allow_module_level=True)
+
+from sqlalchemy import Integer, String, insert, select  # noqa: E402
+from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column  # noqa: E402
+
+from src.db.database import Database, DatabaseConfig  # noqa: E402
+
+
+class _Base(DeclarativeBase):
+    pass
+
+
+class _Item(_Base):
+    __tablename__ = "test_session_items"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    name: Mapped[str] = mapped_column(String(50))
+
+
+@pytest.fixture
+async def db():
+    database = Database(DatabaseConfig(database_url=TEST_DATABASE_URL))
+    async with database.engine.begin() as conn:
+        await conn.run_sync(_Base.metadata.create_all)
+        await conn.execute(insert(_Item), [{"id": 1, "name": "first"}])
+    yield database
+    async with database.engine.begin() as conn:
+        await conn.run_sync(_Base.metadata.drop_all)
+    await database.close()
+
+
+@pytest.mark.asyncio
+async def test_read_only_session_objects_usable_after_exit(db):
+    """Test objects loaded in a read-only session can be read after it closes."""
+    async with db.session(read_only=True) as session:
+        items = (await session.execute(select(_Item))).scalars().all()
+
+    assert [item.name for item in items] == ["first"]
+
+
+@pytest.mark.asyncio
+async def test_read_only_session_rejects_writes(db):
+    """Test a read-only session refuses to write."""
+    with pytest.raises(Exception, match="read-only"):
+        async with db.session(read_only=True) as session:
+            await session.execute(insert(_Item).values(id=2, name="second"))
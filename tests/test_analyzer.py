@@ -264,6 +264,19 @@ async def test_analyze_full_page(analyzer, mock_llm_router, sample_page_data):
     assert call_args.kwargs["session_id"] == "test-session"
 
 
+@pytest.mark.asyncio
+async def test_evidence_timestamps_are_utc_aware(analyzer, mock_llm_router, sample_page_data):
+    """Test every evidence timestamp in one report is timezone-aware."""
+    mock_llm_router.route.return_value = {"content": "[]", "model": "m", "usage": {}}
+
+    result = await analyzer.analyze(sample_page_data, session_id="test-session")
+
+    timestamps = [e.timestamp for issue in result.issues_found for e in issue.evidence]
+    assert timestamps
+    assert all(ts.utcoffset() is not None for ts in timestamps)
+    sorted(timestamps)
+
+
 @pytest.mark.asyncio
 async def test_analyze_clean_page(analyzer, mock_llm_router):
     """Test analysis of a page with no issues."""
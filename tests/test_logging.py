@@ -1,10 +1,25 @@
 """Tests for logging configuration."""
 
+import io
+import logging
+import re
+import threading
+
 import pytest
 import structlog
 
-from src.core.config import get_settings
-from src.core.logging import LogContext, get_logger, setup_logging
+from src.core import logging as core_logging
+from src.core.config import Environment, reset_settings
+from src.core.logging import (
+    LogContext,
+    _BufferedStreamHandler,
+    _open_buffered_stream,
+    censor_sensitive_data,
+    get_log_processors,
+    get_logger,
+    make_timestamper,
+    setup_logging,
+)
 
 
 @pytest.fixture
@@ -18,8 +33,8 @@ def mock_env(monkeypatch):
     monkeypatch.setenv("OPENROUTER_API_KEY", "test_openrouter")
     monkeypatch.setenv("SECRET_KEY", "test_secret")
 
-    # Clear the lru_cache to force reload of settings
-    get_settings.cache_clear()
+    # Drop cached settings to force a reload from the environment
+    reset_settings()
 
 
 def test_setup_logging(mock_env) -> None:
@@ -85,3 +100,138 @@ def test_structured_logging(mock_env) -> None:
 
     # Should not raise exception with structured data
     logger.info("user_action", user_id="123", action="login", success=True)
+
+
+def test_censor_sensitive_data() -> None:
+    """Test that sensitive keys are censored without touching caller data."""
+    config = {"api_key": "sk-123", "url": "https://example.com"}
+    headers = [{"Authorization": "Bearer abc"}, {"accept": "json"}]
+    event_dict = {
+        "event": "request",
+        "user_password": "hunter2",
+        "config": config,
+        "headers": headers,
+        "status": 200,
+    }
+
+    result = censor_sensitive_data(None, "info", event_dict)
+
+    assert result is event_dict
+    assert result["user_password"] == "***CENSORED***"
+    assert result["config"] == {"api_key": "***CENSORED***", "url": "https://example.com"}
+    assert result["headers"][0] == {"Authorization": "***CENSORED***"}
+    assert result["headers"][1] is headers[1]
+    assert result["status"] == 200
+
+    # Nested values from the caller are copied, not mutated
+    assert config["api_key"] == "sk-123"
+    assert headers[0]["Authorization"] == "Bearer abc"
+
+
+def test_log_processors_scrub_toggle() -> None:
+    """Test that censoring can be left out of the processor chain."""
+    scrubbed = get_log_processors(Environment.PRODUCTION, "BugHive")
+    unscrubbed = get_log_processors(Environment.PRODUCTION, "BugHive", scrub=False)
+
+    assert censor_sensitive_data in scrubbed
+    assert censor_sensitive_data not in unscrubbed
+
+
+def test_timestamper_iso_format() -> None:
+    """Test that the cached timestamper matches structlog's ISO format."""
+    timestamper = make_timestamper()
+
+    first = timestamper(None, "info", {})["timestamp"]
+    second = timestamper(None, "info", {})["timestamp"]
+
+    pattern = r"^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}\.\d{6}Z$"
+    assert re.match(pattern, first)
+    assert re.match(pattern, second)
+    assert second >= first
+
+
+def test_log_processors_built_once() -> None:
+    """Test that the processor chain is reused for the same configuration."""
+    first = get_log_processors(Environment.DEVELOPMENT, "BugHive")
+    second = get_log_processors(Environment.DEVELOPMENT, "BugHive")
+
+    assert first is second
+    assert get_log_processors(Environment.PRODUCTION, "BugHive") is not first
+
+
+def test_nested_log_context_restores_outer() -> None:
+    """Test that leaving a nested LogContext keeps the outer context."""
+    with LogContext(request_id="outer"):
+        with LogContext(request_id="inner", user_id="user-456"):
+            assert structlog.contextvars.get_contextvars() == {
+                "request_id": "inner",
+                "user_id": "user-456",
+            }
+
+        assert structlog.contextvars.get_contextvars() == {"request_id": "outer"}
+
+    assert structlog.contextvars.get_contextvars() == {}
+
+
+def test_censor_embedded_json_payload() -> None:
+    """Test that *_json string payloads are censored only when needed."""
+    clean = '{"url": "https://example.com",  "status": 200}'
+    event_dict = {
+        "event": "evidence",
+        "headers_json": '{"Authorization": "Bearer abc", "accept": "json"}',
+        "console_json": clean,
+        "note": '{"token": "not a payload key"}',
+    }
+
+    result = censor_sensitive_data(None, "info", event_dict)
+
+    assert result["headers_json"] == '{"Authorization":"***CENSORED***","accept":"json"}'
+    assert result["console_json"] is clean
+    assert result["note"] == '{"token": "not a payload key"}'
+
+
+class _CountingRaw(io.RawIOBase):
+    """Raw stream that records each underlying write."""
+
+    def __init__(self) -> None:
+        self.writes: list[bytes] = []
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        self.writes.append(bytes(data))
+        return len(data)
+
+
+def test_buffered_handler_batches_writes() -> None:
+    """Test that records share underlying writes until the buffer is flushed."""
+    raw = _CountingRaw()
+    handler = _BufferedStreamHandler(_open_buffered_stream(raw))
+    handler.setFormatter(logging.Formatter("%(message)s"))
+
+    for i in range(100):
+        handler.emit(logging.makeLogRecord({"msg": f"line {i}"}))
+    assert raw.writes == []
+
+    handler.flush_buffer()
+
+    assert len(raw.writes) == 1
+    lines = b"".join(raw.writes).decode().splitlines()
+    assert lines == [f"line {i}" for i in range(100)]
+
+
+def test_setup_logging_reuses_listener(mock_env, monkeypatch) -> None:
+    """Test that repeated setup starts the listener thread only once."""
+    root_logger = logging.getLogger()
+    monkeypatch.setattr(root_logger, "handlers", [])
+    setup_logging()
+    listener = core_logging._log_listener
+    threads = threading.active_count()
+
+    monkeypatch.setattr(root_logger, "handlers", [])
+    setup_logging()
+
+    assert core_logging._log_listener is listener
+    assert threading.active_count() == threads
+    assert root_logger.handlers == [core_logging._log_queue_handler]